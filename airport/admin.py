@@ -7,9 +7,11 @@ from .models import (
     Airport,
     Airplane,
     Route,
+    FlightSchedule,
     Flight,
     Order,
     Ticket,
+    SeatHold,
 )
 
 admin.site.register(AirplaneType)
@@ -18,6 +20,8 @@ admin.site.register(Crew)
 admin.site.register(Airport)
 admin.site.register(Airplane)
 admin.site.register(Route)
+admin.site.register(FlightSchedule)
 admin.site.register(Flight)
 admin.site.register(Order)
 admin.site.register(Ticket)
+admin.site.register(SeatHold)
@@ -0,0 +1,158 @@
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+
+from airport.models import Flight, RouteOccupancy
+
+# output names of the grouping fields of occupancy rows
+OCCUPANCY_GROUPS = {
+    "route": {
+        "route_id": "route",
+        "source": "route__source__name",
+        "destination": "route__destination__name",
+    },
+    "day": {"day": "date"},
+    "airplane_type": {
+        "airplane_type_id": "airplane_type",
+        "airplane_type": "airplane_type__name",
+    },
+}
+
+
+def refresh_occupancy(date_from=None, date_to=None, batch_size=1000):
+    """Rebuild the occupancy of the flights departing in a window.
+
+    Both dates are inclusive, an open window rebuilds everything.
+    Sold seats come from ``Flight.seats_sold``, tickets are not read.
+    Return the number of rows written.
+    """
+    flights = Flight.objects.all()
+    rows = RouteOccupancy.objects.all()
+
+    if date_from:
+        flights = flights.filter(
+            departure_time__gte=datetime.combine(date_from, time.min)
+        )
+        rows = rows.filter(date__gte=date_from)
+
+    if date_to:
+        flights = flights.filter(
+            departure_time__lt=datetime.combine(
+                date_to + timedelta(days=1), time.min
+            )
+        )
+        rows = rows.filter(date__lte=date_to)
+
+    aggregates = (
+        flights.annotate(date=TruncDate("departure_time"))
+        .values("date", "route", airplane_type=F("airplane__airplane_type"))
+        .annotate(
+            flight_count=Count("id"),
+            seat_count=Sum(F("airplane__rows") * F("airplane__seats_in_row")),
+            sold=Sum("seats_sold"),
+        )
+        .order_by()
+    )
+
+    with transaction.atomic():
+        rows.delete()
+        created = RouteOccupancy.objects.bulk_create(
+            (
+                RouteOccupancy(
+                    date=aggregate["date"],
+                    route_id=aggregate["route"],
+                    airplane_type_id=aggregate["airplane_type"],
+                    flights=aggregate["flight_count"],
+                    seats=aggregate["seat_count"],
+                    seats_sold=aggregate["sold"],
+                )
+                for aggregate in aggregates.iterator()
+            ),
+            batch_size=batch_size,
+        )
+
+    return len(created)
+
+
+def refresh_flight_occupancy(flight_id):
+    """Recount the sold seats of the occupancy row of a flight.
+
+    The count is taken from the flights of the row, so running this
+    again or after refresh_occupancy is harmless.
+    """
+    flight = (
+        Flight.objects.select_related("airplane")
+        .filter(pk=flight_id)
+        .first()
+    )
+
+    if flight is None:
+        return
+
+    date = flight.departure_time.date()
+    start = datetime.combine(date, time.min)
+    sold = Flight.objects.filter(
+        route_id=flight.route_id,
+        airplane__airplane_type_id=flight.airplane.airplane_type_id,
+        departure_time__gte=start,
+        departure_time__lt=start + timedelta(days=1),
+    ).aggregate(sold=Sum("seats_sold"))["sold"]
+    RouteOccupancy.objects.filter(
+        date=date,
+        route_id=flight.route_id,
+        airplane_type_id=flight.airplane.airplane_type_id,
+    ).update(seats_sold=sold or 0)
+
+
+def occupancy_totals(group, date_from=None, date_to=None):
+    rows = RouteOccupancy.objects.all()
+
+    if date_from:
+        rows = rows.filter(date__gte=date_from)
+
+    if date_to:
+        rows = rows.filter(date__lte=date_to)
+
+    return rows.values(*group.values()).annotate(
+        flight_count=Sum("flights"),
+        seat_count=Sum("seats"),
+        sold=Sum("seats_sold"),
+    )
+
+
+def occupancy(group_by, date_from=None, date_to=None):
+    """Flights, seats, sold seats and load factor per group"""
+    group = OCCUPANCY_GROUPS[group_by]
+    totals = occupancy_totals(group, date_from, date_to).order_by(
+        *group.values()
+    )
+
+    return [occupancy_row(total, group) for total in totals]
+
+
+def top_routes(limit, date_from=None, date_to=None):
+    """Routes with the most seats sold in the window"""
+    group = OCCUPANCY_GROUPS["route"]
+    totals = occupancy_totals(group, date_from, date_to).order_by(
+        "-sold", "route"
+    )
+
+    return [occupancy_row(total, group) for total in totals[:limit]]
+
+
+def occupancy_row(total, group):
+    row = {name: total[field] for name, field in group.items()}
+    row.update(
+        flights=total["flight_count"],
+        seats=total["seat_count"],
+        seats_sold=total["sold"],
+        load_factor=(
+            round(total["sold"] / total["seat_count"], 4)
+            if total["seat_count"]
+            else None
+        ),
+    )
+
+    return row
@@ -0,0 +1,262 @@
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from airport.models import (
+    AirplaneType,
+    City,
+    Crew,
+    Airport,
+    Airplane,
+    Route,
+    Flight,
+    Order,
+    Ticket,
+)
+from airport.serializers import FlightListSerializer, RouteListSerializer
+from airport.values_serializers import (
+    FlightValuesSerializer,
+    RouteValuesSerializer,
+)
+
+FIRST_DEPARTURE = datetime(2024, 6, 1, 6, 0)
+SCHEDULE_DAYS = 30
+
+
+def generate_data(cities, flights, orders, seed=0):
+    """Fill the database with a reproducible airport network.
+
+    Every city gets one airport and routes to up to five other cities.
+    Flights are spread over SCHEDULE_DAYS days, and orders of one to
+    four tickets are spread over a hundred customers, the first of
+    which is the frequent flyer used by the scenarios.
+    """
+    rng = random.Random(seed)
+    airplane_type = AirplaneType.objects.create(name="Benchmark")
+    airplanes = Airplane.objects.bulk_create(
+        Airplane(
+            name=f"Airplane {number}",
+            rows=rows,
+            seats_in_row=seats_in_row,
+            airplane_type=airplane_type,
+        )
+        for number, (rows, seats_in_row) in enumerate(
+            [(26, 6), (30, 6), (40, 9)] * 3
+        )
+    )
+    crew = Crew.objects.bulk_create(
+        Crew(first_name=f"First {number}", last_name=f"Last {number}")
+        for number in range(cities * 2)
+    )
+    city_objects = City.objects.bulk_create(
+        City(name=f"City {number}") for number in range(cities)
+    )
+    airports = Airport.objects.bulk_create(
+        Airport(name=f"Airport {city.name}", closest_big_city=city)
+        for city in city_objects
+    )
+    routes = Route.objects.bulk_create(
+        Route(source=source, destination=destination, distance=500)
+        for source in airports
+        for destination in rng.sample(airports, min(6, cities))
+        if destination != source
+    )
+    flight_objects = []
+
+    for _ in range(flights):
+        departure_time = FIRST_DEPARTURE + timedelta(
+            minutes=rng.randrange(SCHEDULE_DAYS * 24 * 60 // 5) * 5
+        )
+        flight_objects.append(
+            Flight(
+                route=rng.choice(routes),
+                airplane=rng.choice(airplanes),
+                departure_time=departure_time,
+                arrival_time=departure_time + timedelta(hours=2),
+            )
+        )
+
+    flight_objects = Flight.objects.bulk_create(flight_objects)
+    Flight.crew.through.objects.bulk_create(
+        Flight.crew.through(flight_id=flight.id, crew_id=member.id)
+        for flight in flight_objects
+        for member in rng.sample(crew, 3)
+    )
+    password = make_password("benchmark")
+    users = get_user_model().objects.bulk_create(
+        get_user_model()(
+            email=f"customer{number}@benchmark.com", password=password
+        )
+        for number in range(100)
+    )
+    order_objects = Order.objects.bulk_create(
+        Order(user=users[0] if number % 10 == 0 else rng.choice(users))
+        for number in range(orders)
+    )
+    next_seat = {}
+    tickets = []
+
+    for order in order_objects:
+        for flight in rng.sample(flight_objects, rng.randint(1, 4)):
+            index = next_seat.get(flight.id, 0)
+
+            if index == flight.airplane.rows * flight.airplane.seats_in_row:
+                continue
+
+            next_seat[flight.id] = index + 1
+            row, seat = divmod(index, flight.airplane.seats_in_row)
+            tickets.append(
+                Ticket(order=order, flight=flight, row=row + 1, seat=seat + 1)
+            )
+
+    Ticket.objects.bulk_create(tickets)
+    call_command("reconcile_seats", stdout=StringIO())
+
+    return users[0]
+
+
+def percentile(values, percent):
+    values = sorted(values)
+    index = min(len(values) - 1, round(percent / 100 * (len(values) - 1)))
+
+    return values[index]
+
+
+def measure(client, requests):
+    """Run (method, url, data) requests, return latency and query stats"""
+    latencies = []
+    queries = []
+    started = time.perf_counter()
+
+    for method, url, data in requests:
+        with CaptureQueriesContext(connection) as context:
+            request_started = time.perf_counter()
+            response = getattr(client, method)(url, data, format="json")
+            latencies.append((time.perf_counter() - request_started) * 1000)
+
+        if response.status_code >= 400:
+            raise RuntimeError(
+                f"{method.upper()} {url} returned {response.status_code}"
+            )
+
+        queries.append(len(context.captured_queries))
+
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "mean_ms": round(statistics.mean(latencies), 2),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "queries": max(queries),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+    }
+
+
+def serializer_costs(repeat=5):
+    """Microseconds per row to fetch and render the hot lists.
+
+    Map list names to the best time of the model serializer and of
+    the values serializer rendering every row of the table.
+    """
+    lists = {
+        "flight_list": (
+            Flight.objects.select_related(
+                "route__source", "route__destination", "airplane"
+            ).prefetch_related("crew"),
+            FlightListSerializer,
+            FlightValuesSerializer,
+        ),
+        "route_list": (
+            Route.objects.select_related("source", "destination"),
+            RouteListSerializer,
+            RouteValuesSerializer,
+        ),
+    }
+    costs = {}
+
+    for name, (queryset, model_serializer, values_serializer) in (
+        lists.items()
+    ):
+        rows = queryset.count()
+        timings = {"model": [], "values": []}
+
+        for _ in range(repeat):
+            started = time.perf_counter()
+            model_serializer(queryset.all(), many=True).data
+            timings["model"].append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            values_serializer(values_serializer.get_rows(queryset.all())).data
+            timings["values"].append(time.perf_counter() - started)
+
+        costs[name] = {
+            "rows": rows,
+            **{
+                f"{kind}_us_per_row": round(min(times) / rows * 10**6, 1)
+                for kind, times in timings.items()
+            },
+        }
+
+    return costs
+
+
+def scenarios(requests, seed=0):
+    """Map scenario names to lists of (method, url, data) requests"""
+    rng = random.Random(seed)
+    flight_ids = list(Flight.objects.values_list("id", flat=True))
+    flight_url = reverse("airport:flight-list")
+    order_url = reverse("airport:order-list")
+    days = [
+        (FIRST_DEPARTURE + timedelta(days=day)).strftime("%Y-%m-%d")
+        for day in range(SCHEDULE_DAYS)
+    ]
+    free_flights = Flight.objects.filter(seats_sold=0).select_related(
+        "airplane"
+    )
+    free_seats = (
+        {"flight": flight.id, "row": row, "seat": seat}
+        for flight in free_flights
+        for row in range(1, flight.airplane.rows + 1)
+        for seat in range(1, flight.airplane.seats_in_row + 1)
+    )
+
+    return {
+        "flight_list": [
+            ("get", flight_url, {"date": rng.choice(days)})
+            for _ in range(requests)
+        ],
+        "flight_list_cursor": [
+            ("get", flight_url, {"cursor": "", "page_size": 50})
+            for _ in range(requests)
+        ],
+        "flight_retrieve": [
+            (
+                "get",
+                reverse(
+                    "airport:flight-detail", args=[rng.choice(flight_ids)]
+                ),
+                None,
+            )
+            for _ in range(requests)
+        ],
+        "order_list": [("get", order_url, None) for _ in range(requests)],
+        "order_create": [
+            (
+                "post",
+                order_url,
+                {"tickets": [next(free_seats), next(free_seats)]},
+            )
+            for _ in range(requests)
+        ],
+    }
@@ -0,0 +1,152 @@
+import os
+import threading
+
+import psycopg2
+import psycopg2.extras
+from django.db.backends.postgresql import base
+from psycopg2.pool import ThreadedConnectionPool
+
+from airport.db_backend import stats
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class ConnectionPool(ThreadedConnectionPool):
+    """psycopg2 pool recording the connections it opens and reuses.
+
+    Up to ``minconn`` idle connections are kept open, the others are
+    closed when returned.
+    """
+
+    def __init__(self, alias, minconn, maxconn, **kwargs):
+        self.alias = alias
+        super().__init__(minconn, maxconn, **kwargs)
+
+    def _getconn(self, key=None):
+        if self._pool and (key is None or key not in self._used):
+            stats.record(self.alias, "pool_hits")
+
+        return super()._getconn(key)
+
+    def _connect(self, key=None):
+        stats.record(self.alias, "opened")
+        return super()._connect(key)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """PostgreSQL backend with connection health checks and pooling.
+
+    CONN_HEALTH_CHECKS is backported from Django 4.1: a persistent
+    connection is checked once per request before it is reused, and
+    dropped if the server closed it.
+
+    With ``"POOL": {"MIN_SIZE": ..., "MAX_SIZE": ...}`` in the database
+    settings, connections are taken from a pool shared by the threads
+    of the process and given back to it instead of being closed. Set
+    MAX_SIZE to at least the number of threads of a worker.
+    """
+
+    health_check_done = False
+
+    @property
+    def pool(self):
+        return _pools.get((self.alias, os.getpid()))
+
+    def get_pool(self, conn_params):
+        options = self.settings_dict.get("POOL")
+
+        if not options:
+            return None
+
+        key = (self.alias, os.getpid())
+
+        with _pools_lock:
+            if key not in _pools:
+                _pools[key] = ConnectionPool(
+                    self.alias,
+                    options.get("MIN_SIZE", 1),
+                    options["MAX_SIZE"],
+                    **conn_params,
+                )
+                stats.register_pool(self.alias, _pools[key])
+
+        return _pools[key]
+
+    def get_new_connection(self, conn_params):
+        pool = self.get_pool(conn_params)
+
+        if pool is None:
+            stats.record(self.alias, "opened")
+            return super().get_new_connection(conn_params)
+
+        connection = pool.getconn()
+
+        while self.settings_dict.get(
+            "CONN_HEALTH_CHECKS"
+        ) and not self.check_connection(connection):
+            stats.record(self.alias, "health_check_failures")
+            pool.putconn(connection, close=True)
+            connection = pool.getconn()
+
+        options = self.settings_dict["OPTIONS"]
+        self.isolation_level = options.get(
+            "isolation_level", connection.isolation_level
+        )
+
+        if self.isolation_level != connection.isolation_level:
+            connection.set_session(isolation_level=self.isolation_level)
+
+        psycopg2.extras.register_default_jsonb(
+            conn_or_curs=connection, loads=lambda x: x
+        )
+
+        return connection
+
+    @staticmethod
+    def check_connection(connection):
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+
+            if not connection.autocommit:
+                connection.rollback()
+        except psycopg2.Error:
+            return False
+
+        return True
+
+    def connect(self):
+        super().connect()
+        self.health_check_done = True
+
+    def _close(self):
+        pool = self.pool
+
+        if pool is None or self.connection is None:
+            return super()._close()
+
+        with self.wrap_database_errors:
+            pool.putconn(self.connection)
+
+    def close_if_unusable_or_obsolete(self):
+        super().close_if_unusable_or_obsolete()
+        self.health_check_done = False
+
+    def close_if_health_check_failed(self):
+        if (
+            self.connection is None
+            or not self.settings_dict.get("CONN_HEALTH_CHECKS")
+            or self.health_check_done
+        ):
+            return
+
+        if not self.is_usable():
+            stats.record(self.alias, "health_check_failures")
+            self.close()
+
+        self.health_check_done = True
+
+    def _cursor(self, name=None):
+        self.close_if_health_check_failed()
+        return super()._cursor(name)
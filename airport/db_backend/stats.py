@@ -0,0 +1,68 @@
+import os
+import threading
+from collections import Counter, defaultdict
+
+from django.core.signals import request_started
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+_lock = threading.Lock()
+_requests = Counter()
+_events = defaultdict(Counter)
+_pools = {}
+
+
+@receiver(request_started)
+def count_request(sender, **kwargs):
+    with _lock:
+        _requests["total"] += 1
+
+
+@receiver(connection_created)
+def count_connection(sender, connection, **kwargs):
+    record(connection.alias, "connects")
+
+
+def record(alias, *events):
+    with _lock:
+        _events[alias].update(events)
+
+
+def register_pool(alias, pool):
+    _pools[alias] = pool
+
+
+def snapshot():
+    """Connection statistics of the current process.
+
+    ``connects`` counts connections Django opened (taken from the pool
+    when pooling is on), so the reuse ratio is the share of requests
+    served on a connection kept from an earlier request. The pooling
+    backend adds ``opened`` (new server connections), ``pool_hits``
+    (idle pooled connections taken again) and
+    ``health_check_failures``.
+    """
+    with _lock:
+        requests = _requests["total"]
+        databases = {}
+
+        for alias, events in _events.items():
+            stats = dict(events)
+            stats["reuse_ratio"] = (
+                round(max(requests - events["connects"], 0) / requests, 3)
+                if requests
+                else None
+            )
+            pool = _pools.get(alias)
+
+            if pool is not None:
+                stats["pool"] = {
+                    "min_size": pool.minconn,
+                    "max_size": pool.maxconn,
+                    "in_use": len(pool._used),
+                    "idle": len(pool._pool),
+                }
+
+            databases[alias] = stats
+
+    return {"pid": os.getpid(), "requests": requests, "databases": databases}
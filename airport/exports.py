@@ -0,0 +1,62 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from airport.models import Ticket
+
+EXPORT_FIELDS = (
+    ("order_id", "order_id"),
+    ("order_created_at", "order__created_at"),
+    ("user_email", "order__user__email"),
+    ("ticket_id", "id"),
+    ("row", "row"),
+    ("seat", "seat"),
+    ("flight_id", "flight_id"),
+    ("source", "flight__route__source__name"),
+    ("destination", "flight__route__destination__name"),
+    ("departure_time", "flight__departure_time"),
+    ("arrival_time", "flight__arrival_time"),
+)
+CHUNK_SIZE = 2000
+
+
+def export_rows(created_from=None, created_to=None):
+    """Yield ticket rows of orders created in [created_from, created_to)"""
+    tickets = Ticket.objects.order_by("order_id", "id")
+
+    if created_from:
+        tickets = tickets.filter(order__created_at__gte=created_from)
+
+    if created_to:
+        tickets = tickets.filter(order__created_at__lt=created_to)
+
+    return tickets.values_list(
+        *(lookup for _, lookup in EXPORT_FIELDS)
+    ).iterator(chunk_size=CHUNK_SIZE)
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+def to_csv(rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(name for name, _ in EXPORT_FIELDS)
+
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def to_ndjson(rows):
+    names = [name for name, _ in EXPORT_FIELDS]
+
+    for row in rows:
+        yield json.dumps(dict(zip(names, row)), cls=DjangoJSONEncoder) + "\n"
+
+
+EXPORT_FORMATS = {
+    "csv": (to_csv, "text/csv"),
+    "ndjson": (to_ndjson, "application/x-ndjson"),
+}
@@ -0,0 +1,93 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from airport.models import IdempotencyKey
+
+HEADER = "Idempotency-Key"
+
+
+def request_fingerprint(request):
+    body = json.dumps(request.data, sort_keys=True, cls=DjangoJSONEncoder)
+
+    return hashlib.sha256(
+        f"{request.method} {request.path} {body}".encode()
+    ).hexdigest()
+
+
+class IdempotentCreateMixin:
+    """Answer retried creates sent with the same Idempotency-Key.
+
+    The key, a fingerprint of the request and the successful response
+    are stored per user for IDEMPOTENCY_KEY_TTL, in the transaction of
+    the create. A retry gets the stored response back without running
+    the create again; reusing a key for another request is rejected.
+    Failed creates are not stored, so they can be retried.
+    """
+
+    def create(self, request, *args, **kwargs):
+        key = request.headers.get(HEADER)
+
+        if key is None:
+            return super().create(request, *args, **kwargs)
+
+        if not 0 < len(key) <= 255:
+            raise ValidationError(f"{HEADER} must have 1 to 255 characters")
+
+        fingerprint = request_fingerprint(request)
+        stored = IdempotencyKey.objects.filter(
+            user=request.user, key=key
+        ).first()
+
+        if stored is not None:
+            if stored.expires_at > timezone.now():
+                return self.replay(stored, fingerprint)
+
+            stored.delete()
+
+        try:
+            with transaction.atomic():
+                stored = IdempotencyKey.objects.create(
+                    user=request.user,
+                    key=key,
+                    fingerprint=fingerprint,
+                    expires_at=timezone.now()
+                    + settings.IDEMPOTENCY_KEY_TTL,
+                )
+                response = super().create(request, *args, **kwargs)
+                stored.status_code = response.status_code
+                stored.response = response.data
+                stored.save(update_fields=["status_code", "response"])
+        except IntegrityError:
+            # the same key was used by a concurrent request
+            stored = IdempotencyKey.objects.filter(
+                user=request.user, key=key
+            ).first()
+
+            if stored is None:
+                raise
+
+            return self.replay(stored, fingerprint)
+
+        return response
+
+    @staticmethod
+    def replay(stored, fingerprint):
+        if stored.fingerprint != fingerprint:
+            return Response(
+                {"detail": f"{HEADER} was already used for another request"},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+
+        return Response(
+            stored.response,
+            status=stored.status_code,
+            headers={"Idempotent-Replayed": "true"},
+        )
@@ -0,0 +1,142 @@
+import heapq
+from collections import defaultdict, namedtuple
+from datetime import timedelta
+from itertools import count
+
+from django.core.cache import cache
+from django.db.models import F
+
+from airport.models import Flight
+
+MIN_CONNECTION_TIME = timedelta(minutes=45)
+MAX_CONNECTION_TIME = timedelta(hours=24)
+MAX_LEGS = 3
+CACHE_TIMEOUT = 300
+
+Leg = namedtuple(
+    "Leg",
+    (
+        "flight_id",
+        "source_id",
+        "destination_id",
+        "source_city_id",
+        "destination_city_id",
+        "departure_time",
+        "arrival_time",
+    ),
+)
+
+
+def load_flight_graph(date, seats=1):
+    """Map source airport id to flights departing in the search window.
+
+    The window starts at ``date`` and is long enough for the last leg
+    of an itinerary that departs at the end of that day. Only flights
+    with at least ``seats`` available seats are loaded.
+    """
+    window_end = date + timedelta(days=1) + (MAX_LEGS - 1) * (
+        MAX_CONNECTION_TIME + timedelta(days=1)
+    )
+    flights = (
+        Flight.objects.filter(
+            departure_time__gte=date,
+            departure_time__lt=window_end,
+            seats_sold__lte=(
+                F("airplane__rows") * F("airplane__seats_in_row") - seats
+            ),
+        )
+        .order_by("departure_time")
+        .values_list(
+            "id",
+            "route__source_id",
+            "route__destination_id",
+            "route__source__closest_big_city_id",
+            "route__destination__closest_big_city_id",
+            "departure_time",
+            "arrival_time",
+        )
+    )
+    graph = defaultdict(list)
+
+    for flight in flights:
+        leg = Leg(*flight)
+        graph[leg.source_id].append(leg)
+
+    return graph
+
+
+def find_itineraries(graph, from_city_id, to_city_id, date, limit=10):
+    """Return up to ``limit`` itineraries as lists of flight ids.
+
+    Partial itineraries are expanded in order of arrival time, so
+    itineraries reach the destination city ranked by arrival, then by
+    number of legs, then by the latest departure. Connections are made
+    at the arrival airport between MIN_CONNECTION_TIME and
+    MAX_CONNECTION_TIME, and no city is visited twice.
+    """
+    day_end = date + timedelta(days=1)
+    tie_breaker = count()
+    queue = []
+
+    def push(legs):
+        heapq.heappush(
+            queue,
+            (
+                legs[-1].arrival_time,
+                len(legs),
+                -legs[0].departure_time.timestamp(),
+                next(tie_breaker),
+                legs,
+            ),
+        )
+
+    for flights in graph.values():
+        for leg in flights:
+            if leg.departure_time >= day_end:
+                break
+
+            if leg.source_city_id == from_city_id:
+                push([leg])
+
+    itineraries = []
+
+    while queue and len(itineraries) < limit:
+        legs = heapq.heappop(queue)[-1]
+        last = legs[-1]
+
+        if last.destination_city_id == to_city_id:
+            itineraries.append([leg.flight_id for leg in legs])
+            continue
+
+        if len(legs) == MAX_LEGS:
+            continue
+
+        visited = {legs[0].source_city_id}
+        visited.update(leg.destination_city_id for leg in legs)
+
+        for leg in graph[last.destination_id]:
+            connection_time = leg.departure_time - last.arrival_time
+
+            if connection_time > MAX_CONNECTION_TIME:
+                break
+
+            if (
+                connection_time >= MIN_CONNECTION_TIME
+                and leg.destination_city_id not in visited
+            ):
+                push(legs + [leg])
+
+    return itineraries
+
+
+def search_itineraries(from_city_id, to_city_id, date, seats=1):
+    """Cached itineraries from one city to another departing on ``date``"""
+    key = f"itineraries:{from_city_id}:{to_city_id}:{date:%Y-%m-%d}:{seats}"
+    itineraries = cache.get(key)
+
+    if itineraries is None:
+        graph = load_flight_graph(date, seats)
+        itineraries = find_itineraries(graph, from_city_id, to_city_id, date)
+        cache.set(key, itineraries, CACHE_TIMEOUT)
+
+    return itineraries
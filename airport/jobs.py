@@ -0,0 +1,101 @@
+import logging
+import traceback
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from airport.models import Job
+
+logger = logging.getLogger("airport.jobs")
+
+
+def enqueue(task, **kwargs):
+    """Queue a call of a module level function with JSON kwargs.
+
+    The job is written in the current transaction, so it runs only if
+    the work queuing it is committed.
+    """
+    return Job.objects.create(
+        task=f"{task.__module__}.{task.__name__}",
+        kwargs=kwargs,
+        max_attempts=settings.JOB_MAX_ATTEMPTS,
+    )
+
+
+def claim_jobs(batch_size):
+    """Mark due jobs as running and return them.
+
+    A running job is due again once JOB_TIMEOUT has passed, in case
+    its worker died. Locked rows are skipped so that several workers
+    can share the queue.
+    """
+    now = timezone.now()
+
+    with transaction.atomic():
+        jobs = list(
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(
+                status__in=(Job.Status.QUEUED, Job.Status.RUNNING),
+                run_at__lte=now,
+            )
+            .order_by("run_at", "id")[:batch_size]
+        )
+        Job.objects.filter(id__in=[job.id for job in jobs]).update(
+            status=Job.Status.RUNNING,
+            attempts=F("attempts") + 1,
+            run_at=now + settings.JOB_TIMEOUT,
+        )
+
+    for job in jobs:
+        job.attempts += 1
+
+    return jobs
+
+
+def run_job(job):
+    """Run a claimed job, delete it once done or schedule a retry.
+
+    Retries back off exponentially from JOB_RETRY_DELAY; a job failing
+    max_attempts times is kept as dead with the last traceback.
+    """
+    try:
+        with transaction.atomic():
+            import_string(job.task)(**job.kwargs)
+            job.delete()
+    except Exception:
+        error = traceback.format_exc()
+
+        if job.attempts >= job.max_attempts:
+            status, run_at = Job.Status.DEAD, timezone.now()
+            logger.error("Job %s is dead:\n%s", job, error)
+        else:
+            status = Job.Status.QUEUED
+            run_at = timezone.now() + settings.JOB_RETRY_DELAY * (
+                2 ** (job.attempts - 1)
+            )
+            logger.warning("Job %s failed, retrying:\n%s", job, error)
+
+        Job.objects.filter(pk=job.pk).update(
+            status=status, run_at=run_at, last_error=error
+        )
+
+        return False
+
+    return True
+
+
+def run_pending(batch_size=10):
+    """Run due jobs until none is left, return (done, failed) counts"""
+    done = failed = 0
+
+    while jobs := claim_jobs(batch_size):
+        for job in jobs:
+            if run_job(job):
+                done += 1
+            else:
+                failed += 1
+
+    return done, failed
@@ -0,0 +1,151 @@
+import json
+import os
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import BaseCommand, CommandError
+from django.db import connection
+from rest_framework.test import APIClient
+from rest_framework.views import APIView
+
+from airport.benchmark import (
+    generate_data,
+    measure,
+    scenarios,
+    serializer_costs,
+)
+
+DEFAULT_BASELINE = os.path.join(
+    settings.BASE_DIR, "benchmarks", "baseline.json"
+)
+
+
+class Command(BaseCommand):
+    """Benchmark the browsing and booking endpoints on generated data.
+
+    The data is generated in a test database created next to the
+    configured one (SQLite or PostgreSQL) and dropped afterwards.
+    Results are compared with the stored baseline of the same database
+    vendor and data size: more queries per request is a regression, as
+    is a p95 latency above the baseline by more than --tolerance.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--cities", type=int, default=20)
+        parser.add_argument("--flights", type=int, default=2000)
+        parser.add_argument("--orders", type=int, default=500)
+        parser.add_argument("--requests", type=int, default=50)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+        parser.add_argument("--save-baseline", action="store_true")
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.5,
+            help="Allowed relative p95 latency increase, 0.5 by default",
+        )
+
+    def handle(self, *args, **options):
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True
+        )
+
+        try:
+            results = self.run_benchmark(options)
+            costs = serializer_costs()
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        key = (
+            f"{connection.vendor}:{options['cities']}:{options['flights']}:"
+            f"{options['orders']}"
+        )
+        baselines = {}
+
+        if os.path.exists(options["baseline"]):
+            with open(options["baseline"]) as baseline_file:
+                baselines = json.load(baseline_file)
+
+        regressions = self.report(
+            results, baselines.get(key, {}), options["tolerance"]
+        )
+        self.report_serializer_costs(costs)
+
+        if options["save_baseline"]:
+            baselines[key] = results
+
+            with open(options["baseline"], "w") as baseline_file:
+                json.dump(baselines, baseline_file, indent=2, sort_keys=True)
+                baseline_file.write("\n")
+
+            self.stdout.write(f"Saved baseline {key}")
+        elif regressions:
+            raise CommandError(f"{regressions} regression(s) found")
+
+    def run_benchmark(self, options):
+        cache.clear()
+        user = generate_data(
+            options["cities"],
+            options["flights"],
+            options["orders"],
+            seed=options["seed"],
+        )
+        client = APIClient()
+        client.force_authenticate(user)
+        results = {}
+
+        # throttling would reject the scripted requests
+        with mock.patch.object(APIView, "get_throttles", return_value=[]):
+            for name, requests in scenarios(
+                options["requests"], seed=options["seed"]
+            ).items():
+                measure(client, requests[:1])
+                results[name] = measure(client, requests[1:])
+
+        return results
+
+    def report_serializer_costs(self, costs):
+        self.stdout.write(
+            f"{'list':<20}{'rows':>9}{'model us':>10}{'values us':>10}"
+            f"{'speedup':>9}"
+        )
+
+        for name, cost in costs.items():
+            speedup = cost["model_us_per_row"] / cost["values_us_per_row"]
+            self.stdout.write(
+                f"{name:<20}{cost['rows']:>9}"
+                f"{cost['model_us_per_row']:>10}"
+                f"{cost['values_us_per_row']:>10}{speedup:>8.1f}x"
+            )
+
+    def report(self, results, baseline, tolerance):
+        regressions = 0
+        self.stdout.write(
+            f"{'scenario':<20}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+            f"{'req/s':>9}{'queries':>9}"
+        )
+
+        for name, stats in results.items():
+            line = (
+                f"{name:<20}{stats['p50_ms']:>9}{stats['p95_ms']:>9}"
+                f"{stats['p99_ms']:>9}{stats['requests_per_second']:>9}"
+                f"{stats['queries']:>9}"
+            )
+            expected = baseline.get(name)
+
+            if expected and stats["queries"] > expected["queries"]:
+                regressions += 1
+                line += f"  queries regressed from {expected['queries']}"
+
+            if expected and stats["p95_ms"] > expected["p95_ms"] * (
+                1 + tolerance
+            ):
+                regressions += 1
+                line += f"  p95 regressed from {expected['p95_ms']} ms"
+
+            self.stdout.write(
+                self.style.ERROR(line) if "regressed" in line else line
+            )
+
+        return regressions
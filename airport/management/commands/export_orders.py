@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta
+
+from django.core.management import BaseCommand
+
+from airport.exports import EXPORT_FORMATS, export_rows
+
+
+def parse_date(value):
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format", choices=EXPORT_FORMATS, default="csv"
+        )
+        parser.add_argument("--date-from", type=parse_date)
+        parser.add_argument("--date-to", type=parse_date)
+        parser.add_argument("--output", help="File path, stdout by default")
+
+    def handle(self, *args, **options):
+        date_to = options["date_to"]
+        rows = export_rows(
+            options["date_from"], date_to and date_to + timedelta(days=1)
+        )
+        write, _ = EXPORT_FORMATS[options["format"]]
+
+        if options["output"]:
+            with open(options["output"], "w", newline="") as output:
+                output.writelines(write(rows))
+        else:
+            for line in write(rows):
+                self.stdout.write(line, ending="")
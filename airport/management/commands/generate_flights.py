@@ -0,0 +1,45 @@
+from datetime import date, datetime, timedelta
+
+from django.core.management import BaseCommand
+from django.db.models import F, Q
+
+from airport.models import FlightSchedule
+
+
+def parse_date(value):
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--until",
+            type=parse_date,
+            help="Last date to generate flights for (ex. 2024-12-31)",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Horizon in days from today, if --until is not set",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        until = options["until"] or date.today() + timedelta(
+            days=options["days"]
+        )
+        schedules = FlightSchedule.objects.filter(
+            Q(generated_until__isnull=True) | Q(generated_until__lt=until),
+            Q(end_date__isnull=True) | Q(end_date__gte=F("start_date")),
+        )
+        created = 0
+
+        for schedule in schedules:
+            created += schedule.generate_flights(
+                until, batch_size=options["batch_size"]
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Created {created} flight(s) until {until}")
+        )
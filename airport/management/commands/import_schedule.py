@@ -0,0 +1,239 @@
+import csv
+import json
+import os
+import time
+from itertools import islice
+
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+
+from airport.models import (
+    City,
+    Crew,
+    Airport,
+    Airplane,
+    Route,
+    Flight,
+)
+from airport.response_cache import bump_version
+
+
+class Command(BaseCommand):
+    """Import flights from a CSV or JSON lines schedule file.
+
+    Every row describes one flight: source_airport, source_city,
+    destination_airport, destination_city, distance, airplane,
+    departure_time, arrival_time and crew ("First Last" names separated
+    by ";" in CSV, a list in JSON lines). Missing cities, airports,
+    routes and crew are created, airplanes must exist.
+
+    Rows are imported in chunks, each in its own transaction, and the
+    number of imported rows is written to a checkpoint file, so an
+    interrupted import continues after the last chunk with --resume.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=("csv", "jsonl"))
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument("--resume", action="store_true")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or (
+            "csv" if path.endswith(".csv") else "jsonl"
+        )
+        checkpoint_path = f"{path}.checkpoint"
+        skip = 0
+
+        if options["resume"] and os.path.exists(checkpoint_path):
+            with open(checkpoint_path) as checkpoint:
+                skip = int(checkpoint.read())
+
+        self.load_lookups()
+        imported = skip
+        started = time.monotonic()
+
+        with open(path, newline="") as schedule:
+            rows = islice(self.read_rows(schedule, file_format), skip, None)
+
+            while True:
+                chunk = list(islice(rows, options["chunk_size"]))
+
+                if not chunk:
+                    break
+
+                chunk_started = time.monotonic()
+
+                try:
+                    self.import_chunk(chunk, first_line=imported + 1)
+                except (KeyError, ValueError) as error:
+                    raise CommandError(
+                        f"Invalid row after row {imported}: {error!r}"
+                    )
+
+                imported += len(chunk)
+
+                with open(checkpoint_path, "w") as checkpoint:
+                    checkpoint.write(str(imported))
+
+                for model in (City, Airport, Route, Crew):
+                    bump_version(model)
+
+                self.stdout.write(
+                    f"Imported {imported} flight(s), "
+                    f"{len(chunk) / self.elapsed(chunk_started):.0f} "
+                    f"flights/s"
+                )
+
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {imported - skip} flight(s) in "
+                f"{self.elapsed(started):.1f}s"
+            )
+        )
+
+    @staticmethod
+    def elapsed(started):
+        return max(time.monotonic() - started, 1e-6)
+
+    @staticmethod
+    def read_rows(schedule, file_format):
+        if file_format == "csv":
+            for row in csv.DictReader(schedule):
+                row["crew"] = [
+                    name for name in row.get("crew", "").split(";") if name
+                ]
+                yield row
+        else:
+            for line in schedule:
+                if line.strip():
+                    yield json.loads(line)
+
+    def load_lookups(self):
+        self.cities = dict(City.objects.values_list("name", "id"))
+        self.airports = dict(Airport.objects.values_list("name", "id"))
+        self.airplanes = {}
+        self.routes = {
+            (source_id, destination_id): route_id
+            for route_id, source_id, destination_id in (
+                Route.objects.values_list("id", "source_id", "destination_id")
+            )
+        }
+        self.crew = {
+            (first_name, last_name): crew_id
+            for crew_id, first_name, last_name in Crew.objects.values_list(
+                "id", "first_name", "last_name"
+            )
+        }
+
+        for airplane_id, name in Airplane.objects.values_list("id", "name"):
+            self.airplanes.setdefault(name, airplane_id)
+
+    @transaction.atomic
+    def import_chunk(self, chunk, first_line):
+        self.create_missing(
+            City,
+            self.cities,
+            {
+                row[f"{end}_city"]: {"name": row[f"{end}_city"]}
+                for row in chunk
+                for end in ("source", "destination")
+            },
+        )
+        self.create_missing(
+            Airport,
+            self.airports,
+            {
+                row[f"{end}_airport"]: {
+                    "name": row[f"{end}_airport"],
+                    "closest_big_city_id": self.cities[row[f"{end}_city"]],
+                }
+                for row in chunk
+                for end in ("source", "destination")
+            },
+        )
+        routes = {}
+        crew = {}
+
+        for line, row in enumerate(chunk, start=first_line):
+            row["crew"] = {
+                tuple(name.strip().partition(" ")[::2]) for name in row["crew"]
+            }
+
+            source_id = self.airports[row["source_airport"]]
+            destination_id = self.airports[row["destination_airport"]]
+
+            if source_id == destination_id:
+                raise CommandError(
+                    f"Row {line}: Source and Destination cannot be the same"
+                )
+
+            if int(row["distance"]) < 1:
+                raise CommandError(f"Row {line}: distance must be positive")
+
+            routes[(source_id, destination_id)] = {
+                "source_id": source_id,
+                "destination_id": destination_id,
+                "distance": int(row["distance"]),
+            }
+
+            for first_name, last_name in row["crew"]:
+                crew[(first_name, last_name)] = {
+                    "first_name": first_name,
+                    "last_name": last_name,
+                }
+
+        self.create_missing(Route, self.routes, routes)
+        self.create_missing(Crew, self.crew, crew)
+        flights = []
+
+        for line, row in enumerate(chunk, start=first_line):
+            if row["airplane"] not in self.airplanes:
+                raise CommandError(
+                    f"Row {line}: unknown airplane {row['airplane']}"
+                )
+
+            departure_time = parse_datetime(row["departure_time"])
+            arrival_time = parse_datetime(row["arrival_time"])
+
+            if departure_time is None or arrival_time is None:
+                raise CommandError(f"Row {line}: invalid datetime")
+
+            flights.append(
+                Flight(
+                    route_id=self.routes[
+                        (
+                            self.airports[row["source_airport"]],
+                            self.airports[row["destination_airport"]],
+                        )
+                    ],
+                    airplane_id=self.airplanes[row["airplane"]],
+                    departure_time=departure_time,
+                    arrival_time=arrival_time,
+                )
+            )
+
+        Flight.objects.bulk_create(flights)
+        Flight.crew.through.objects.bulk_create(
+            Flight.crew.through(flight_id=flight.id, crew_id=self.crew[name])
+            for flight, row in zip(flights, chunk)
+            for name in row["crew"]
+        )
+
+    @staticmethod
+    def create_missing(model, lookup, objects):
+        """Bulk create objects missing from lookup and add their ids"""
+        missing = {
+            key: model(**fields)
+            for key, fields in objects.items()
+            if key not in lookup
+        }
+        model.objects.bulk_create(missing.values())
+
+        for key, instance in missing.items():
+            lookup[key] = instance.id
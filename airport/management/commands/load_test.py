@@ -0,0 +1,68 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from statistics import quantiles
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from django.core.management import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """Send concurrent GET requests to a running server.
+
+    Reports requests per second and latency percentiles, so that
+    server profiles (runserver, gunicorn with different worker
+    counts) can be compared on the same endpoints.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("urls", nargs="+")
+        parser.add_argument("--requests", type=int, default=1000)
+        parser.add_argument("--concurrency", type=int, default=16)
+        parser.add_argument("--token", default="")
+
+    def handle(self, *args, **options):
+        headers = {}
+
+        if options["token"]:
+            headers["Authorization"] = f"Bearer {options['token']}"
+
+        urls = options["urls"]
+        requests = [
+            Request(urls[i % len(urls)], headers=headers)
+            for i in range(options["requests"])
+        ]
+
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(options["concurrency"]) as executor:
+            results = list(executor.map(self.send, requests))
+
+        elapsed = time.perf_counter() - started
+        errors = [status for status, _ in results if status >= 400]
+
+        if len(errors) == len(results):
+            raise CommandError(f"All requests failed, e.g. {errors[0]}")
+
+        latencies = sorted(latency for _, latency in results)
+        percentiles = quantiles(latencies, n=100)
+        self.stdout.write(
+            f"{len(results)} requests in {elapsed:.2f}s: "
+            f"{len(results) / elapsed:.1f} req/s, "
+            f"p50 {percentiles[49] * 1000:.1f} ms, "
+            f"p95 {percentiles[94] * 1000:.1f} ms, "
+            f"{len(errors)} errors"
+        )
+
+    @staticmethod
+    def send(request):
+        started = time.perf_counter()
+
+        try:
+            with urlopen(request) as response:
+                response.read()
+                status = response.status
+        except HTTPError as error:
+            status = error.code
+
+        return status, time.perf_counter() - started
@@ -0,0 +1,18 @@
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from airport.throttling import get_store
+
+
+class Command(BaseCommand):
+    def handle(self, *args, **options):
+        store = get_store(
+            settings.THROTTLE_BACKEND, settings.THROTTLE_LOCATION
+        )
+        store.purge(time.time())
+
+        self.stdout.write(
+            self.style.SUCCESS("Purged expired throttle counters")
+        )
@@ -0,0 +1,76 @@
+from collections import defaultdict
+
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from airport.models import Flight, Ticket
+from airport.seat_map import SeatMap
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        flight_ids = Flight.objects.order_by("id").values_list("id", flat=True)
+        reconciled = 0
+        last_id = 0
+
+        while True:
+            batch = list(flight_ids.filter(id__gt=last_id)[:batch_size])
+
+            if not batch:
+                break
+
+            reconciled += self.reconcile_batch(batch)
+            last_id = batch[-1]
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Reconciled {reconciled} flight(s)")
+        )
+
+    @transaction.atomic
+    def reconcile_batch(self, flight_ids):
+        # lock before reading tickets, so no booking commits in between
+        flights = list(
+            Flight.objects.select_for_update(of=("self",))
+            .select_related("airplane")
+            .filter(id__in=flight_ids)
+        )
+        seats = defaultdict(list)
+        tickets = Ticket.objects.filter(flight_id__in=flight_ids).values_list(
+            "flight_id", "row", "seat"
+        )
+
+        for flight_id, row, seat in tickets:
+            seats[flight_id].append((row, seat))
+
+        drifted = []
+
+        for flight in flights:
+            seat_map = SeatMap(
+                flight.airplane.rows, flight.airplane.seats_in_row
+            )
+
+            for row, seat in seats[flight.id]:
+                seat_map.take(row, seat)
+
+            seats_sold = len(seats[flight.id])
+
+            if (
+                flight.seats_sold != seats_sold
+                or SeatMap.for_flight(flight).to_bytes()
+                != seat_map.to_bytes()
+            ):
+                self.stdout.write(
+                    f"Flight {flight.id}: seats_sold {flight.seats_sold} "
+                    f"-> {seats_sold}"
+                )
+                flight.seats_sold = seats_sold
+                flight.seat_map = seat_map.to_bytes()
+                drifted.append(flight)
+
+        Flight.objects.bulk_update(drifted, ["seats_sold", "seat_map"])
+
+        return len(drifted)
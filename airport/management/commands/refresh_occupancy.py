@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from django.core.management import BaseCommand
+
+from airport.analytics import refresh_occupancy
+
+
+def parse_date(value):
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date-from",
+            type=parse_date,
+            help="First departure date to rebuild (ex. 2024-05-01)",
+        )
+        parser.add_argument(
+            "--date-to",
+            type=parse_date,
+            help="Last departure date to rebuild, inclusive",
+        )
+
+    def handle(self, *args, **options):
+        count = refresh_occupancy(options["date_from"], options["date_to"])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {count} occupancy row(s)")
+        )
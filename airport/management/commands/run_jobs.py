@@ -0,0 +1,49 @@
+import time
+
+from django.core.management import BaseCommand
+from django.db import close_old_connections
+
+from airport.jobs import run_pending
+from airport.models import Job
+
+
+class Command(BaseCommand):
+    """Run queued jobs, polling the queue until stopped"""
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=10)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds between polls of an empty queue",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once no job is due",
+        )
+        parser.add_argument(
+            "--requeue-dead",
+            action="store_true",
+            help="Queue dead jobs again before running",
+        )
+
+    def handle(self, *args, **options):
+        if options["requeue_dead"]:
+            count = Job.objects.filter(status=Job.Status.DEAD).update(
+                status=Job.Status.QUEUED, attempts=0
+            )
+            self.stdout.write(f"Queued {count} dead job(s) again")
+
+        while True:
+            done, failed = run_pending(options["batch_size"])
+
+            if done or failed:
+                self.stdout.write(f"Ran {done} job(s), {failed} failed")
+
+            if options["once"]:
+                break
+
+            close_old_connections()
+            time.sleep(options["interval"])
@@ -0,0 +1,41 @@
+# Generated by Django 4.0.4 on 2026-10-17 04:10
+
+from django.db import migrations, models
+
+
+def fill_seat_map(apps, schema_editor):
+    # the bitmap layout of airport.seat_map.SeatMap at this migration:
+    # bit (row - 1) * seats_in_row + seat - 1, most significant first
+    Flight = apps.get_model("airport", "Flight")
+    Ticket = apps.get_model("airport", "Ticket")
+
+    for flight in Flight.objects.select_related("airplane").iterator():
+        seats_in_row = flight.airplane.seats_in_row
+        seat_map = bytearray(
+            (flight.airplane.rows * seats_in_row + 7) // 8
+        )
+
+        for row, seat in Ticket.objects.filter(flight=flight).values_list(
+            "row", "seat"
+        ):
+            index = (row - 1) * seats_in_row + seat - 1
+            seat_map[index // 8] |= 0x80 >> (index % 8)
+
+        flight.seat_map = bytes(seat_map)
+        flight.save(update_fields=["seat_map"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('airport', '0005_flight_seats_sold'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='flight',
+            name='seat_map',
+            field=models.BinaryField(default=b'', editable=False),
+        ),
+        migrations.RunPython(fill_seat_map, migrations.RunPython.noop),
+    ]
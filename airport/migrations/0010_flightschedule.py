@@ -0,0 +1,51 @@
+# Generated by Django 4.0.4 on 2026-10-17 04:07
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('airport', '0009_flight_route_departure_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FlightSchedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('departure_time', models.TimeField()),
+                ('duration', models.DurationField()),
+                ('weekdays', models.CharField(default='1234567', help_text='ISO weekdays of the flights, ex. 123456 for every day except Sunday', max_length=7, validators=[django.core.validators.RegexValidator('^(?!.*(.).*\\1)[1-7]{1,7}$', 'Enter distinct ISO weekday numbers, 1 is Monday')])),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField(blank=True, null=True)),
+                ('generated_until', models.DateField(blank=True, editable=False, null=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='flightschedule',
+            name='airplane',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='schedules', to='airport.airplane'),
+        ),
+        migrations.AddField(
+            model_name='flightschedule',
+            name='crew',
+            field=models.ManyToManyField(blank=True, to='airport.crew'),
+        ),
+        migrations.AddField(
+            model_name='flightschedule',
+            name='route',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='schedules', to='airport.route'),
+        ),
+        migrations.AddField(
+            model_name='flight',
+            name='schedule',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='flights', to='airport.flightschedule'),
+        ),
+        migrations.AddConstraint(
+            model_name='flight',
+            constraint=models.UniqueConstraint(fields=('schedule', 'departure_time'), name='unique_schedule_departure'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.0.4 on 2026-10-17 04:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('airport', '0010_flightschedule'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ThrottleCounter',
+            fields=[
+                ('key', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('period', models.BigIntegerField()),
+                ('count', models.PositiveIntegerField()),
+                ('previous_count', models.PositiveIntegerField()),
+                ('expires', models.BigIntegerField(db_index=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.0.4 on 2026-10-17 04:25
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('airport', '0011_throttlecounter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RouteOccupancy',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('flights', models.PositiveIntegerField()),
+                ('seats', models.PositiveIntegerField()),
+                ('seats_sold', models.PositiveIntegerField()),
+                ('airplane_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='occupancy', to='airport.airplanetype')),
+                ('route', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='occupancy', to='airport.route')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='routeoccupancy',
+            constraint=models.UniqueConstraint(fields=('date', 'route', 'airplane_type'), name='unique_occupancy_date_route_type'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.0.4 on 2026-10-17 04:36
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('airport', '0014_idempotencykey'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='crew',
+            options={'ordering': ['id'], 'verbose_name_plural': 'crew'},
+        ),
+    ]
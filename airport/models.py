@@ -1,7 +1,16 @@
-from django.core.validators import MinValueValidator
-from django.db import models
+import operator
+from datetime import datetime, timedelta
+from functools import reduce
+from itertools import islice
+
+from django.core.validators import MinValueValidator, RegexValidator
+from django.db import models, transaction
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from airport.seat_map import SeatMap
 
 
 class AirplaneType(models.Model):
@@ -26,6 +35,7 @@ class Crew(models.Model):
     last_name = models.CharField(max_length=255)
 
     class Meta:
+        ordering = ["id"]
         verbose_name_plural = "crew"
 
     def __str__(self):
@@ -92,6 +102,120 @@ class Route(models.Model):
         return f"{self.source.name} -> {self.destination.name}"
 
 
+class FlightSchedule(models.Model):
+    route = models.ForeignKey(
+        Route, on_delete=models.CASCADE, related_name="schedules"
+    )
+    airplane = models.ForeignKey(
+        Airplane, on_delete=models.CASCADE, related_name="schedules"
+    )
+    crew = models.ManyToManyField(Crew, blank=True)
+    departure_time = models.TimeField()
+    duration = models.DurationField()
+    weekdays = models.CharField(
+        max_length=7,
+        default="1234567",
+        validators=[
+            RegexValidator(
+                r"^(?!.*(.).*\1)[1-7]{1,7}$",
+                "Enter distinct ISO weekday numbers, 1 is Monday",
+            )
+        ],
+        help_text="ISO weekdays of the flights, ex. 123456 for every day "
+        "except Sunday",
+    )
+    start_date = models.DateField()
+    end_date = models.DateField(null=True, blank=True)
+    generated_until = models.DateField(null=True, blank=True, editable=False)
+
+    def __str__(self):
+        return (
+            f"{str(self.route)} {self.departure_time} "
+            f"on days {self.weekdays}"
+        )
+
+    def departures(self, start, end):
+        """Departure datetimes of the schedule from start to end dates"""
+        if self.end_date:
+            end = min(end, self.end_date)
+
+        day = max(start, self.start_date)
+
+        while day <= end:
+            if str(day.isoweekday()) in self.weekdays:
+                yield datetime.combine(day, self.departure_time)
+
+            day += timedelta(days=1)
+
+    @transaction.atomic
+    def generate_flights(self, until, batch_size=1000):
+        """Create the flights of the schedule up to the until date.
+
+        Flights are unique per schedule and departure time, so running
+        it again for the same dates creates nothing new.
+        """
+        start = self.start_date
+
+        if self.generated_until:
+            start = self.generated_until + timedelta(days=1)
+
+        crew_ids = list(self.crew.values_list("id", flat=True))
+        departures = self.departures(start, until)
+        created = 0
+
+        while True:
+            batch = list(islice(departures, batch_size))
+
+            if not batch:
+                break
+
+            existing = set(
+                Flight.objects.filter(
+                    schedule=self, departure_time__in=batch
+                ).values_list("departure_time", flat=True)
+            )
+            batch = [
+                departure_time
+                for departure_time in batch
+                if departure_time not in existing
+            ]
+            Flight.objects.bulk_create(
+                (
+                    Flight(
+                        schedule=self,
+                        route_id=self.route_id,
+                        airplane_id=self.airplane_id,
+                        departure_time=departure_time,
+                        arrival_time=departure_time + self.duration,
+                    )
+                    for departure_time in batch
+                ),
+                ignore_conflicts=True,
+            )
+            created += len(batch)
+
+            if crew_ids and batch:
+                flight_ids = Flight.objects.filter(
+                    schedule=self, departure_time__in=batch
+                ).values_list("id", flat=True)
+                Flight.crew.through.objects.bulk_create(
+                    (
+                        Flight.crew.through(
+                            flight_id=flight_id, crew_id=crew_id
+                        )
+                        for flight_id in flight_ids
+                        for crew_id in crew_ids
+                    ),
+                    ignore_conflicts=True,
+                )
+
+        if self.generated_until is None or until > self.generated_until:
+            self.generated_until = until
+            self.save(update_fields=["generated_until"])
+
+        return created
+
+
 class Flight(models.Model):
     route = models.ForeignKey(
         Route, on_delete=models.CASCADE, related_name="flights"
@@ -102,9 +226,72 @@ class Flight(models.Model):
     departure_time = models.DateTimeField()
     arrival_time = models.DateTimeField()
     crew = models.ManyToManyField(Crew, blank=True)
+    seats_sold = models.PositiveIntegerField(default=0, editable=False)
+    seat_map = models.BinaryField(default=b"", editable=False)
+    schedule = models.ForeignKey(
+        FlightSchedule,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="flights",
+    )
 
     class Meta:
         ordering = ["-departure_time"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["schedule", "departure_time"],
+                name="unique_schedule_departure",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["-departure_time", "id"],
+                name="flight_departure_id_idx",
+            ),
+            models.Index(
+                fields=["route", "departure_time"],
+                name="flight_route_departure_idx",
+            ),
+        ]
+
+    @property
+    def seats_available(self):
+        return (
+            self.airplane.rows * self.airplane.seats_in_row - self.seats_sold
+        )
+
+    def get_seat_map(self):
+        return SeatMap.for_flight(self)
+
+    @staticmethod
+    @transaction.atomic
+    def change_seats(flight_id, taken=(), released=()):
+        flight = (
+            Flight.objects.select_for_update()
+            .select_related("airplane")
+            .filter(pk=flight_id)
+            .first()
+        )
+
+        if flight is None:
+            return
+
+        seat_map = flight.get_seat_map()
+
+        for row, seat in taken:
+            seat_map.take(row, seat)
+
+        for row, seat in released:
+            seat_map.release(row, seat)
+
+        flight.save_seat_map(seat_map, len(taken) - len(released))
+
+    def save_seat_map(self, seat_map, seats_sold_delta):
+        """Store seat map changes of a flight locked with select_for_update"""
+        self.seat_map = seat_map.to_bytes()
+        self.seats_sold += seats_sold_delta
+        self.save(update_fields=["seat_map", "seats_sold"])
 
     def __str__(self):
         return f"{str(self.route)} {self.departure_time}"
@@ -123,6 +310,12 @@ class Order(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at", "id"],
+                name="order_user_created_id_idx",
+            ),
+        ]
 
 
 class Ticket(models.Model):
@@ -179,3 +372,139 @@ class Ticket(models.Model):
     class Meta:
         unique_together = ("flight", "row", "seat")
         ordering = ["row", "seat"]
+
+
+class SeatHold(models.Model):
+    flight = models.ForeignKey(
+        Flight, on_delete=models.CASCADE, related_name="seat_holds"
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="seat_holds",
+    )
+    row = models.IntegerField()
+    seat = models.IntegerField()
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return (
+            f"{str(self.flight)} (row: {self.row}, seat: {self.seat}) "
+            f"until {self.expires_at}"
+        )
+
+    @staticmethod
+    def seats_filter(seats):
+        """Match any of the seats, given as dicts of field lookups"""
+        return reduce(operator.or_, (models.Q(**seat) for seat in seats))
+
+    class Meta:
+        unique_together = ("flight", "row", "seat")
+        ordering = ["row", "seat"]
+
+
+class RouteOccupancy(models.Model):
+    """Seats of the flights of a route per day and airplane type.
+
+    Rebuilt from flights by airport.analytics.refresh_occupancy; sold
+    seats are also refreshed by queued jobs as tickets are booked or
+    cancelled.
+    """
+
+    date = models.DateField()
+    route = models.ForeignKey(
+        Route, on_delete=models.CASCADE, related_name="occupancy"
+    )
+    airplane_type = models.ForeignKey(
+        AirplaneType, on_delete=models.CASCADE, related_name="occupancy"
+    )
+    flights = models.PositiveIntegerField()
+    seats = models.PositiveIntegerField()
+    seats_sold = models.PositiveIntegerField()
+
+    def __str__(self):
+        return (
+            f"{str(self.route)} on {self.date} ({self.airplane_type}): "
+            f"{self.seats_sold}/{self.seats}"
+        )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "route", "airplane_type"],
+                name="unique_occupancy_date_route_type",
+            )
+        ]
+
+
+class IdempotencyKey(models.Model):
+    """Response of a request made with an Idempotency-Key header"""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="idempotency_keys",
+    )
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True)
+    response = models.JSONField(null=True, encoder=DjangoJSONEncoder)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{self.key} ({self.status_code})"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "key"], name="unique_user_idempotency_key"
+            )
+        ]
+
+
+class ThrottleCounter(models.Model):
+    """Sliding window request counter of a throttle key.
+
+    Requests are counted in fixed periods of the rate duration; the
+    count of the previous period is kept to weight it into the
+    current one. See airport.throttling.
+    """
+
+    key = models.CharField(max_length=255, primary_key=True)
+    period = models.BigIntegerField()
+    count = models.PositiveIntegerField()
+    previous_count = models.PositiveIntegerField()
+    expires = models.BigIntegerField(db_index=True)
+
+    def __str__(self):
+        return f"{self.key}: {self.count} in period {self.period}"
+
+
+class Job(models.Model):
+    """Task call of the database job queue, see airport.jobs"""
+
+    class Status(models.TextChoices):
+        QUEUED = "queued"
+        RUNNING = "running"
+        DEAD = "dead"
+
+    task = models.CharField(max_length=255)
+    kwargs = models.JSONField(default=dict)
+    status = models.CharField(
+        max_length=7, choices=Status.choices, default=Status.QUEUED
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.task} ({self.status}, attempt {self.attempts})"
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "run_at"], name="job_status_run_at_idx"
+            ),
+        ]
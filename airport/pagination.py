@@ -0,0 +1,134 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination over a unique ordering, without COUNT or OFFSET.
+
+    It is enabled per request by the ``cursor`` query parameter
+    (``?cursor=`` for the first page), otherwise ``fallback_class``
+    paginates the response, or it is not paginated at all.
+    """
+
+    ordering = ("-id",)
+    page_size = 10
+    max_page_size = 100
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    fallback_class = None
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.fallback = None
+
+        if self.cursor_query_param not in request.query_params:
+            if self.fallback_class is None:
+                return None
+
+            self.fallback = self.fallback_class()
+
+            return self.fallback.paginate_queryset(queryset, request, view)
+
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.ordering)
+        cursor = request.query_params[self.cursor_query_param]
+
+        if cursor:
+            try:
+                queryset = queryset.filter(
+                    self.after(self.decode_cursor(cursor))
+                )
+            except (ValidationError, TypeError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+
+        page = list(queryset[: page_size + 1])
+        self.has_next = len(page) > page_size
+        page = page[:page_size]
+        self.last = page[-1] if page else None
+
+        return page
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        return min(max(page_size, 1), self.max_page_size)
+
+    def after(self, values):
+        """Filter rows that come after ``values`` in the ordering"""
+        condition = Q()
+        equal = Q()
+
+        for field, value in zip(self.ordering, values):
+            lookup = "lt" if field.startswith("-") else "gt"
+            field = field.lstrip("-")
+            condition |= equal & Q(**{f"{field}__{lookup}": value})
+            equal &= Q(**{field: value})
+
+        return condition
+
+    def decode_cursor(self, cursor):
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise ValueError(self.invalid_cursor_message)
+
+        return values
+
+    def encode_cursor(self, obj):
+        fields = [field.lstrip("-") for field in self.ordering]
+
+        if isinstance(obj, dict):
+            # rows fetched with .values()
+            values = [obj[field] for field in fields]
+        else:
+            values = [getattr(obj, field) for field in fields]
+
+        return base64.urlsafe_b64encode(
+            json.dumps(values, default=str).encode()
+        ).decode()
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(self.last),
+        )
+
+    def get_paginated_response(self, data):
+        if self.fallback is not None:
+            return self.fallback.get_paginated_response(data)
+
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Keyset pagination cursor, "
+                "empty for the first page",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results per cursor page",
+                "schema": {"type": "integer"},
+            },
+        ]
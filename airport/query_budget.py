@@ -0,0 +1,81 @@
+import logging
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger("airport.query_budget")
+
+
+class QueryCounter:
+    """Database execute wrapper counting queries and their duration"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - started
+
+
+class QueryBudgetMiddleware:
+    """Count queries of every request and check the view query budget.
+
+    A viewset declares ``query_budget``, a mapping of action names to
+    the maximum number of queries of a request, authentication and
+    throttling included. Requests over budget are logged as warnings.
+    With DEBUG on, the counts are also sent in X-Query-Count and
+    X-DB-Time-Ms response headers.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        counter = QueryCounter()
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+
+            response = self.get_response(request)
+
+        if settings.DEBUG:
+            response["X-Query-Count"] = str(counter.count)
+            response["X-DB-Time-Ms"] = f"{counter.duration * 1000:.2f}"
+
+        action, budget = self.get_budget(request)
+
+        if budget is not None and counter.count > budget:
+            logger.warning(
+                "%s %s (%s) ran %d queries in %.2f ms, budget is %d",
+                request.method,
+                request.path,
+                action,
+                counter.count,
+                counter.duration * 1000,
+                budget,
+            )
+
+        return response
+
+    @staticmethod
+    def get_budget(request):
+        match = request.resolver_match
+        view_class = getattr(match and match.func, "cls", None)
+        budget = getattr(view_class, "query_budget", None)
+
+        if not budget:
+            return None, None
+
+        actions = getattr(match.func, "actions", None) or {}
+        action = actions.get(request.method.lower())
+
+        return action, budget.get(action)
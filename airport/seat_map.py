@@ -0,0 +1,64 @@
+import base64
+
+
+class SeatMap:
+    """Seat occupancy bitmap of a flight.
+
+    Seat (row, seat) is stored in bit (row - 1) * seats_in_row + seat - 1,
+    most significant bit of each byte first, 1 meaning the seat is taken.
+    """
+
+    def __init__(self, rows, seats_in_row, data=b""):
+        self.rows = rows
+        self.seats_in_row = seats_in_row
+        size = (rows * seats_in_row + 7) // 8
+        self.data = bytearray(bytes(data)[:size].ljust(size, b"\0"))
+
+    @classmethod
+    def for_flight(cls, flight):
+        return cls(
+            flight.airplane.rows,
+            flight.airplane.seats_in_row,
+            flight.seat_map,
+        )
+
+    def _position(self, row, seat):
+        index = (row - 1) * self.seats_in_row + seat - 1
+
+        return index // 8, 0x80 >> (index % 8)
+
+    def is_taken(self, row, seat):
+        byte, mask = self._position(row, seat)
+
+        return bool(self.data[byte] & mask)
+
+    def take(self, row, seat):
+        byte, mask = self._position(row, seat)
+        self.data[byte] |= mask
+
+    def release(self, row, seat):
+        byte, mask = self._position(row, seat)
+        self.data[byte] &= ~mask
+
+    def to_bytes(self):
+        return bytes(self.data)
+
+    def to_base64(self):
+        return base64.b64encode(self.data).decode()
+
+    def to_run_lengths(self):
+        """Lengths of alternating free/taken runs, starting with free."""
+        run_lengths = []
+        current, length = False, 0
+
+        for row in range(1, self.rows + 1):
+            for seat in range(1, self.seats_in_row + 1):
+                if self.is_taken(row, seat) == current:
+                    length += 1
+                else:
+                    run_lengths.append(length)
+                    current, length = not current, 1
+
+        run_lengths.append(length)
+
+        return run_lengths
@@ -1,6 +1,12 @@
-from django.db import transaction
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.utils import timezone
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
+from airport.analytics import refresh_flight_occupancy
+from airport.jobs import enqueue
 from airport.models import (
     AirplaneType,
     City,
@@ -11,7 +17,10 @@ from airport.models import (
     Flight,
     Ticket,
     Order,
+    SeatHold,
 )
+from airport.sparse_fields import SparseFieldsMixin
+from airport.tasks import send_order_confirmation
 
 
 class AirplaneTypeSerializer(serializers.ModelSerializer):
@@ -26,7 +35,7 @@ class CitySerializer(serializers.ModelSerializer):
         fields = ("id", "name")
 
 
-class CrewSerializer(serializers.ModelSerializer):
+class CrewSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Crew
         fields = ("id", "first_name", "last_name", "full_name")
@@ -50,11 +59,13 @@ class AirplaneSerializer(serializers.ModelSerializer):
         fields = ("id", "name", "rows", "seats_in_row", "airplane_type")
 
 
-class AirplaneListSerializer(AirplaneSerializer):
+class AirplaneListSerializer(SparseFieldsMixin, AirplaneSerializer):
     airplane_type = serializers.CharField(
         source="airplane_type.name", read_only=True
     )
 
+    select_related_fields = {"airplane_type": ("airplane_type",)}
+
 
 class RouteSerializer(serializers.ModelSerializer):
     class Meta:
@@ -62,12 +73,17 @@ class RouteSerializer(serializers.ModelSerializer):
         fields = ("id", "source", "destination", "distance")
 
 
-class RouteListSerializer(RouteSerializer):
+class RouteListSerializer(SparseFieldsMixin, RouteSerializer):
     source = serializers.CharField(source="source.name", read_only=True)
     destination = serializers.CharField(
         source="destination.name", read_only=True
     )
 
+    select_related_fields = {
+        "source": ("source",),
+        "destination": ("destination",),
+    }
+
 
 class FlightSerializer(serializers.ModelSerializer):
     class Meta:
@@ -82,42 +98,66 @@ class FlightSerializer(serializers.ModelSerializer):
         )
 
 
-class FlightListSerializer(FlightSerializer):
+class FlightListSerializer(SparseFieldsMixin, FlightSerializer):
     route = serializers.CharField(source="route.trip_name", read_only=True)
     airplane = serializers.CharField(source="airplane.name", read_only=True)
     crew = serializers.SlugRelatedField(
         many=True, read_only=True, slug_field="full_name"
     )
+    tickets_available = serializers.IntegerField(
+        source="seats_available", read_only=True
+    )
 
+    expandable_fields = {
+        "route": lambda: RouteListSerializer(read_only=True),
+        "airplane": lambda: AirplaneListSerializer(read_only=True),
+        "crew": lambda: CrewSerializer(many=True, read_only=True),
+        "taken_places": lambda: TicketSeatsSerializer(
+            source="tickets", many=True, read_only=True
+        ),
+    }
+    select_related_fields = {
+        "route": ("route__source", "route__destination"),
+        "airplane": ("airplane",),
+        "tickets_available": ("airplane",),
+    }
+    prefetch_related_fields = {"crew": ("crew",)}
 
-class TicketSerializer(serializers.ModelSerializer):
-    def validate(self, attrs):
-        data = super(TicketSerializer, self).validate(attrs=attrs)
-        Ticket.validate_ticket(
-            attrs["row"],
-            attrs["seat"],
-            attrs["flight"].airplane,
-            ValidationError,
-        )
+    class Meta:
+        model = Flight
+        fields = FlightSerializer.Meta.fields + ("tickets_available",)
 
-        return data
+
+class ItinerarySerializer(serializers.Serializer):
+    departure_time = serializers.DateTimeField(read_only=True)
+    arrival_time = serializers.DateTimeField(read_only=True)
+    flights = FlightListSerializer(many=True, read_only=True)
+
+
+class TicketSerializer(serializers.ModelSerializer):
+    # flights are loaded once per order, see OrderSerializer
+    flight = serializers.IntegerField(source="flight_id")
 
     class Meta:
         model = Ticket
         fields = ("id", "row", "seat", "flight")
+        # seat availability is checked against the flight seat map
+        validators = []
 
 
-class TicketListSerializer(TicketSerializer):
+class TicketListSerializer(SparseFieldsMixin, TicketSerializer):
     flight = FlightListSerializer(read_only=True)
 
 
-class TicketSeatsSerializer(TicketSerializer):
+class TicketSeatsSerializer(SparseFieldsMixin, TicketSerializer):
+    only_fields = ("flight", "row", "seat")
+
     class Meta:
         model = Ticket
         fields = ("row", "seat")
 
 
-class FlightDetailSerializer(FlightSerializer):
+class FlightDetailSerializer(SparseFieldsMixin, FlightSerializer):
     route = RouteListSerializer(read_only=True)
     airplane = AirplaneListSerializer(read_only=True)
     crew = CrewSerializer(many=True, read_only=True)
@@ -138,6 +178,140 @@ class FlightDetailSerializer(FlightSerializer):
         )
 
 
+class FlightSeatMapDetailSerializer(FlightDetailSerializer):
+    seat_map = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Flight
+        fields = (
+            "id",
+            "route",
+            "airplane",
+            "departure_time",
+            "arrival_time",
+            "crew",
+            "seat_map",
+        )
+
+    select_related_fields = {"seat_map": ("airplane",)}
+
+    def get_seat_map(self, flight) -> dict:
+        encoding = self.context["seat_map_encoding"]
+        seat_map = flight.get_seat_map()
+
+        return {
+            "encoding": encoding,
+            "rows": seat_map.rows,
+            "seats_in_row": seat_map.seats_in_row,
+            "data": (
+                seat_map.to_base64()
+                if encoding == "base64"
+                else seat_map.to_run_lengths()
+            ),
+        }
+
+
+class SeatHoldListSerializer(serializers.ListSerializer):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("allow_empty", False)
+        super().__init__(*args, **kwargs)
+
+    def to_internal_value(self, data):
+        # errors raised here are kept per seat, unlike in validate
+        attrs = super().to_internal_value(data)
+        seen = set()
+        errors = []
+
+        for seat in attrs:
+            if (seat["row"], seat["seat"]) in seen:
+                errors.append(
+                    {
+                        "seat": f"seat {seat['seat']} in row {seat['row']} "
+                        f"is listed more than once"
+                    }
+                )
+            else:
+                seen.add((seat["row"], seat["seat"]))
+                errors.append({})
+
+        if any(errors):
+            raise ValidationError(errors)
+
+        return attrs
+
+    def create(self, validated_data):
+        flight = validated_data[0]["flight"]
+        user = validated_data[0]["user"]
+        seats = [
+            {"row": attrs["row"], "seat": attrs["seat"]}
+            for attrs in validated_data
+        ]
+        now = timezone.now()
+
+        try:
+            with transaction.atomic():
+                SeatHold.objects.filter(flight=flight).filter(
+                    models.Q(expires_at__lte=now)
+                    | models.Q(user=user) & SeatHold.seats_filter(seats)
+                ).delete()
+
+                return SeatHold.objects.bulk_create(
+                    SeatHold(expires_at=now + settings.SEAT_HOLD_TTL, **attrs)
+                    for attrs in validated_data
+                )
+        except IntegrityError:
+            held = set(
+                SeatHold.objects.filter(flight=flight)
+                .filter(SeatHold.seats_filter(seats))
+                .values_list("row", "seat")
+            )
+            raise ValidationError(
+                [
+                    {
+                        "seat": f"seat {seat['seat']} in row {seat['row']} "
+                        f"is already held"
+                    }
+                    if (seat["row"], seat["seat"]) in held
+                    else {}
+                    for seat in seats
+                ]
+            )
+
+
+class SeatHoldSerializer(serializers.ModelSerializer):
+    def validate(self, attrs):
+        data = super(SeatHoldSerializer, self).validate(attrs=attrs)
+        flight = self.context["flight"]
+        Ticket.validate_ticket(
+            attrs["row"],
+            attrs["seat"],
+            flight.airplane,
+            ValidationError,
+        )
+
+        if flight.get_seat_map().is_taken(attrs["row"], attrs["seat"]):
+            raise ValidationError(
+                {
+                    "seat": f"seat {attrs['seat']} in row {attrs['row']} "
+                    f"is already taken"
+                }
+            )
+
+        return data
+
+    class Meta:
+        model = SeatHold
+        fields = ("id", "row", "seat", "expires_at")
+        read_only_fields = ("expires_at",)
+        list_serializer_class = SeatHoldListSerializer
+
+
+def seat_error(row, seat, reason):
+    return serializers.as_serializer_error(
+        ValidationError({"seat": f"seat {seat} in row {row} {reason}"})
+    )
+
+
 class OrderSerializer(serializers.ModelSerializer):
     tickets = TicketSerializer(many=True, read_only=False, allow_empty=False)
 
@@ -145,16 +319,135 @@ class OrderSerializer(serializers.ModelSerializer):
         model = Order
         fields = ("id", "tickets", "created_at")
 
+    def validate_tickets(self, tickets):
+        """Check the tickets against their flights, loaded in one query"""
+        flights = Flight.objects.select_related("airplane").in_bulk(
+            {ticket["flight_id"] for ticket in tickets}
+        )
+        seat_maps = {
+            flight_id: flight.get_seat_map()
+            for flight_id, flight in flights.items()
+        }
+        errors = []
+
+        for ticket in tickets:
+            flight_id, row, seat = (
+                ticket["flight_id"],
+                ticket["row"],
+                ticket["seat"],
+            )
+
+            try:
+                if flight_id not in flights:
+                    raise ValidationError(
+                        {
+                            "flight": f'Invalid pk "{flight_id}" - '
+                            "object does not exist."
+                        }
+                    )
+
+                Ticket.validate_ticket(
+                    row, seat, flights[flight_id].airplane, ValidationError
+                )
+
+                if seat_maps[flight_id].is_taken(row, seat):
+                    raise ValidationError(
+                        {"seat": f"seat {seat} in row {row} is already taken"}
+                    )
+            except ValidationError as error:
+                errors.append(serializers.as_serializer_error(error))
+            else:
+                errors.append({})
+
+        if any(errors):
+            raise ValidationError(errors)
+
+        return tickets
+
     @transaction.atomic
     def create(self, validated_data):
         tickets_data = validated_data.pop("tickets")
-        order = Order.objects.create(**validated_data)
+        flights = {
+            flight.id: flight
+            for flight in Flight.objects.select_for_update(of=("self",))
+            .select_related("airplane")
+            .filter(id__in={ticket["flight_id"] for ticket in tickets_data})
+            .order_by("id")
+        }
+        seat_maps = {
+            flight_id: flight.get_seat_map()
+            for flight_id, flight in flights.items()
+        }
+        held_by_others = set(
+            SeatHold.objects.filter(
+                flight_id__in=flights, expires_at__gt=timezone.now()
+            )
+            .exclude(user=validated_data["user"])
+            .order_by()
+            .values_list("flight_id", "row", "seat")
+        )
+        seats_sold = defaultdict(int)
+        errors = []
 
         for ticket_data in tickets_data:
-            Ticket.objects.create(order=order, **ticket_data)
+            flight_id = ticket_data["flight_id"]
+            row, seat = ticket_data["row"], ticket_data["seat"]
+
+            if seat_maps[flight_id].is_taken(row, seat):
+                errors.append(seat_error(row, seat, "is already taken"))
+                continue
+
+            if (flight_id, row, seat) in held_by_others:
+                errors.append(seat_error(row, seat, "is already held"))
+                continue
+
+            seat_maps[flight_id].take(row, seat)
+            seats_sold[flight_id] += 1
+            errors.append({})
+
+        if any(errors):
+            raise ValidationError({"tickets": errors})
+
+        order = Order.objects.create(**validated_data)
+
+        try:
+            with transaction.atomic():
+                Ticket.objects.bulk_create(
+                    Ticket(order=order, **ticket_data)
+                    for ticket_data in tickets_data
+                )
+        except IntegrityError:
+            # a seat map out of sync with the tickets, see reconcile_seats
+            sold = set(
+                Ticket.objects.filter(SeatHold.seats_filter(tickets_data))
+                .order_by()
+                .values_list("flight_id", "row", "seat")
+            )
+            raise ValidationError(
+                {
+                    "tickets": [
+                        seat_error(
+                            ticket["row"], ticket["seat"], "is already taken"
+                        )
+                        if (ticket["flight_id"], ticket["row"], ticket["seat"])
+                        in sold
+                        else {}
+                        for ticket in tickets_data
+                    ]
+                }
+            )
+
+        for flight_id, count in seats_sold.items():
+            flights[flight_id].save_seat_map(seat_maps[flight_id], count)
+            enqueue(refresh_flight_occupancy, flight_id=flight_id)
+
+        SeatHold.objects.filter(user=order.user).filter(
+            SeatHold.seats_filter(tickets_data)
+        ).delete()
+        enqueue(send_order_confirmation, order_id=order.id)
 
         return order
 
 
-class OrderListSerializer(OrderSerializer):
+class OrderListSerializer(SparseFieldsMixin, OrderSerializer):
     tickets = TicketListSerializer(many=True, read_only=True)
@@ -0,0 +1,85 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from airport.models import (
+    AirplaneType,
+    City,
+    Crew,
+    Airport,
+    Airplane,
+    Route,
+    Flight,
+    Ticket,
+)
+from airport.analytics import refresh_flight_occupancy
+from airport.jobs import enqueue
+from airport.response_cache import bump_version
+
+
+@receiver(pre_save, sender=Ticket)
+def remember_previous_seat(sender, instance, **kwargs):
+    instance.previous_seat = (
+        Ticket.objects.filter(pk=instance.pk)
+        .values_list("flight_id", "row", "seat")
+        .first()
+        if instance.pk
+        else None
+    )
+
+
+@receiver(post_save, sender=Ticket)
+def increment_seats_sold(sender, instance, created, **kwargs):
+    seat = (instance.flight_id, instance.row, instance.seat)
+    previous = getattr(instance, "previous_seat", None)
+
+    if created:
+        Flight.change_seats(
+            instance.flight_id, taken=[(instance.row, instance.seat)]
+        )
+        enqueue(refresh_flight_occupancy, flight_id=instance.flight_id)
+    elif previous is not None and previous != seat:
+        # the ticket moved to another seat
+        previous_flight_id, row, seat_number = previous
+
+        if previous_flight_id == instance.flight_id:
+            Flight.change_seats(
+                instance.flight_id,
+                taken=[(instance.row, instance.seat)],
+                released=[(row, seat_number)],
+            )
+        else:
+            Flight.change_seats(
+                previous_flight_id, released=[(row, seat_number)]
+            )
+            Flight.change_seats(
+                instance.flight_id, taken=[(instance.row, instance.seat)]
+            )
+            enqueue(refresh_flight_occupancy, flight_id=previous_flight_id)
+            enqueue(refresh_flight_occupancy, flight_id=instance.flight_id)
+
+
+@receiver(post_delete, sender=Ticket)
+def decrement_seats_sold(sender, instance, **kwargs):
+    Flight.change_seats(
+        instance.flight_id, released=[(instance.row, instance.seat)]
+    )
+    enqueue(refresh_flight_occupancy, flight_id=instance.flight_id)
+
+
+@receiver(post_save, sender=AirplaneType)
+@receiver(post_delete, sender=AirplaneType)
+@receiver(post_save, sender=City)
+@receiver(post_delete, sender=City)
+@receiver(post_save, sender=Crew)
+@receiver(post_delete, sender=Crew)
+@receiver(post_save, sender=Airport)
+@receiver(post_delete, sender=Airport)
+@receiver(post_save, sender=Airplane)
+@receiver(post_delete, sender=Airplane)
+@receiver(post_save, sender=Route)
+@receiver(post_delete, sender=Route)
+def bump_cached_list_version(sender, **kwargs):
+    # a request between the change and the commit would otherwise cache
+    # the old rows under the new version
+    transaction.on_commit(lambda: bump_version(sender))
@@ -0,0 +1,173 @@
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+
+def parse_field_tree(value):
+    """Parse ``a,b.c,b.d`` into ``{"a": {}, "b": {"c": {}, "d": {}}}``"""
+    tree = {}
+
+    for path in value.split(","):
+        node = tree
+
+        for name in path.strip().split("."):
+            if name:
+                node = node.setdefault(name, {})
+
+    return tree
+
+
+class SparseFieldsMixin:
+    """Serializer rendering only requested fields, expanding others.
+
+    The ``fields`` and ``expand`` trees (see parse_field_tree) are read
+    from the context by the top serializer and passed down to nested
+    ones. ``fields`` keeps the listed fields only, a field without
+    subfields is kept whole. ``expand`` replaces fields by the
+    serializers built by ``expandable_fields``.
+
+    ``select_related_fields`` and ``prefetch_related_fields`` name the
+    relations a field reads, so that apply_query_plan loads only what
+    the remaining fields need, and ``only_fields`` restricts the
+    columns loaded for the serializer.
+
+    Unknown names, and subfields of fields without any, are rejected.
+    """
+
+    expandable_fields = {}
+    select_related_fields = {}
+    prefetch_related_fields = {}
+    only_fields = None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        sparse_fields, expand = self.get_field_trees()
+
+        for name in expand:
+            if name in self.expandable_fields:
+                fields[name] = self.expandable_fields[name]()
+
+        nested = {
+            name
+            for name, field in fields.items()
+            if isinstance(getattr(field, "child", field), SparseFieldsMixin)
+        }
+        check_names(
+            "expand", expand, set(self.expandable_fields) | nested, nested
+        )
+
+        if sparse_fields:
+            check_names("fields", sparse_fields, set(fields), nested)
+            fields = {
+                name: field
+                for name, field in fields.items()
+                if name in sparse_fields
+            }
+
+        for name in nested & set(fields):
+            field = fields[name]
+            getattr(field, "child", field).field_trees = (
+                sparse_fields.get(name, {}),
+                expand.get(name, {}),
+            )
+
+        return fields
+
+    def get_field_trees(self):
+        if hasattr(self, "field_trees"):
+            return self.field_trees
+
+        parent = self.parent
+
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+
+        if parent is not None:
+            return {}, {}
+
+        return self.context.get("fields", {}), self.context.get("expand", {})
+
+
+def check_names(param, tree, known, nested):
+    unknown = set(tree) - known
+
+    if unknown:
+        raise ValidationError(
+            {param: f"Unknown fields: {', '.join(sorted(unknown))}"}
+        )
+
+    flat = {name for name, subtree in tree.items() if subtree} - nested
+
+    if flat:
+        raise ValidationError(
+            {param: f"Fields without subfields: {', '.join(sorted(flat))}"}
+        )
+
+
+def apply_query_plan(queryset, serializer):
+    """Select and prefetch the relations read by the serializer fields"""
+    only_fields = getattr(serializer, "only_fields", None)
+
+    if only_fields is not None:
+        queryset = queryset.only(*only_fields)
+
+    select, prefetch = related_lookups(queryset.model, serializer)
+
+    if select:
+        queryset = queryset.select_related(*select)
+
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+
+    return queryset
+
+
+def related_lookups(model, serializer, prefix=""):
+    select_fields = getattr(serializer, "select_related_fields", {})
+    prefetch_fields = getattr(serializer, "prefetch_related_fields", {})
+    select, prefetch = [], []
+
+    for name, field in serializer.fields.items():
+        if not isinstance(field, serializers.BaseSerializer):
+            select += [
+                prefix + lookup for lookup in select_fields.get(name, ())
+            ]
+            prefetch += [
+                prefix + lookup for lookup in prefetch_fields.get(name, ())
+            ]
+            continue
+
+        related_model = model._meta.get_field(field.source).related_model
+
+        if isinstance(field, serializers.ListSerializer):
+            prefetch.append(
+                Prefetch(
+                    prefix + field.source,
+                    queryset=apply_query_plan(
+                        related_model.objects.all(), field.child
+                    ),
+                )
+            )
+        else:
+            lookup = prefix + field.source
+            nested_select, nested_prefetch = related_lookups(
+                related_model, field, f"{lookup}__"
+            )
+            select += [lookup, *nested_select]
+            prefetch += nested_prefetch
+
+    return select, prefetch
+
+
+class SparseFieldsViewMixin:
+    """Pass the ``?fields=`` and ``?expand=`` trees to serializers"""
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+
+        if self.request is not None:
+            params = self.request.query_params
+            context["fields"] = parse_field_tree(params.get("fields", ""))
+            context["expand"] = parse_field_tree(params.get("expand", ""))
+
+        return context
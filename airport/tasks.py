@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.db.models import Prefetch
+
+from airport.jobs import enqueue
+from airport.models import Order, Ticket
+
+
+def send_order_confirmation(order_id):
+    """Write the confirmation document of an order and notify the user"""
+    order = (
+        Order.objects.select_related("user")
+        .prefetch_related(
+            Prefetch(
+                "tickets",
+                queryset=Ticket.objects.select_related(
+                    "flight__route__source", "flight__route__destination"
+                ),
+            )
+        )
+        .filter(pk=order_id)
+        .first()
+    )
+
+    if order is None:
+        return
+
+    document = {
+        "order": order.id,
+        "created_at": order.created_at.isoformat(),
+        "passenger": order.user.email,
+        "tickets": [
+            {
+                "flight": ticket.flight_id,
+                "route": str(ticket.flight.route),
+                "departure_time": ticket.flight.departure_time.isoformat(),
+                "arrival_time": ticket.flight.arrival_time.isoformat(),
+                "row": ticket.row,
+                "seat": ticket.seat,
+            }
+            for ticket in order.tickets.all()
+        ],
+    }
+    path = Path(settings.CONFIRMATION_ROOT) / f"order-{order.id}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2))
+
+    enqueue(
+        notify,
+        recipient=order.user.email,
+        subject=f"Your order #{order.id} is confirmed",
+        attachment=str(path),
+    )
+
+
+def notify(recipient, subject, body="", attachment=None):
+    """Deliver a notification to NOTIFICATION_SINK.
+
+    The sink is a JSON lines file standing in for an email service.
+    """
+    path = Path(settings.NOTIFICATION_SINK)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with path.open("a") as sink:
+        sink.write(
+            json.dumps(
+                {
+                    "recipient": recipient,
+                    "subject": subject,
+                    "body": body,
+                    "attachment": attachment,
+                }
+            )
+            + "\n"
+        )
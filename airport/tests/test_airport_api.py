@@ -1,5 +1,6 @@
 from datetime import datetime
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
@@ -14,6 +15,8 @@ from airport.models import (
     Crew,
     Airplane,
     Flight,
+    Order,
+    Ticket,
 )
 from airport.serializers import (
     RouteListSerializer,
@@ -25,6 +28,7 @@ from airport.serializers import (
 AIRPORT_URL = reverse("airport:airport-list")
 ROUTE_URL = reverse("airport:route-list")
 FLIGHT_URL = reverse("airport:flight-list")
+FLIGHT_SEARCH_URL = reverse("airport:flight-search")
 
 
 def sample_city(**params):
@@ -81,7 +85,7 @@ def sample_crew(**params):
 
 
 def sample_airplane(**params):
-    airplane_type = sample_airplane_type()
+    airplane_type = params.get("airplane_type") or sample_airplane_type()
     defaults = {
         "name": "Airbus A318",
         "rows": 26,
@@ -94,8 +98,8 @@ def sample_airplane(**params):
 
 
 def sample_flight(**params):
-    route = sample_route()
-    airplane = sample_airplane()
+    route = params.get("route") or sample_route()
+    airplane = params.get("airplane") or sample_airplane()
     defaults = {
         "route": route,
         "airplane": airplane,
@@ -122,6 +126,7 @@ class UnauthorizedAirportApiTests(TestCase):
 
 class AuthorizedAirportApiTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user = get_user_model().objects.create_user(
             email="test@test.com", password="test123"
@@ -223,6 +228,87 @@ class AuthorizedAirportApiTests(TestCase):
         self.assertIn(serializer.data, response_2.data)
         self.assertNotIn(serializer.data, response_3.data)
 
+    def test_filter_flight_by_date(self):
+        route = sample_route()
+        airplane = sample_airplane()
+        flight_1 = sample_flight(
+            route=route,
+            airplane=airplane,
+            departure_time="2024-06-02T23:59:00",
+            arrival_time="2024-06-03T01:40:00",
+        )
+        flight_2 = sample_flight(
+            route=route,
+            airplane=airplane,
+            departure_time="2024-06-03T00:00:00",
+            arrival_time="2024-06-03T01:40:00",
+        )
+
+        response = self.client.get(FLIGHT_URL, {"date": "2024-06-02"})
+
+        serializer_1 = FlightListSerializer(flight_1)
+        serializer_2 = FlightListSerializer(flight_2)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(serializer_1.data, response.data)
+        self.assertNotIn(serializer_2.data, response.data)
+
+    def test_filter_flight_by_date_range(self):
+        route = sample_route()
+        airplane = sample_airplane()
+        flights = [
+            sample_flight(
+                route=route,
+                airplane=airplane,
+                departure_time=f"2024-06-0{day}T14:00:00",
+                arrival_time=f"2024-06-0{day}T15:40:00",
+            )
+            for day in range(1, 5)
+        ]
+
+        response = self.client.get(
+            FLIGHT_URL, {"date_from": "2024-06-02", "date_to": "2024-06-03"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [flight["id"] for flight in response.data],
+            [flights[2].id, flights[1].id],
+        )
+
+    def test_search_flights_by_cities(self):
+        route = sample_route()
+        reverse_route = Route.objects.create(
+            source=route.destination, destination=route.source, distance=1020
+        )
+        airplane = sample_airplane()
+        flight = sample_flight(route=route, airplane=airplane)
+        sample_flight(route=reverse_route, airplane=airplane)
+        sample_flight(
+            route=route,
+            airplane=airplane,
+            departure_time="2024-06-05T14:00:00",
+            arrival_time="2024-06-05T15:40:00",
+        )
+
+        response = self.client.get(
+            FLIGHT_SEARCH_URL,
+            {
+                "from_city": route.source.closest_big_city_id,
+                "to_city": route.destination.closest_big_city_id,
+                "date_from": "2024-06-01",
+                "date_to": "2024-06-03",
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [FlightListSerializer(flight).data])
+
+    def test_search_flights_requires_cities(self):
+        response = self.client.get(FLIGHT_SEARCH_URL, {"from_city": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_retrieve_flight_detail(self):
         flight = sample_flight()
 
@@ -236,6 +322,50 @@ class AuthorizedAirportApiTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(serializer.data, response.data)
 
+    def test_batch_flight_detail(self):
+        route = sample_route()
+        airplane = sample_airplane()
+        flights = [
+            sample_flight(route=route, airplane=airplane) for _ in range(3)
+        ]
+        flights[1].crew.add(sample_crew())
+        Ticket.objects.create(
+            order=Order.objects.create(user=self.user),
+            flight=flights[1],
+            row=1,
+            seat=1,
+        )
+        ids = [flights[2].id, flights[1].id]
+
+        response = self.client.get(
+            FLIGHT_URL,
+            {"ids": ",".join(str(id_) for id_ in ids), "expand": "detail"},
+        )
+        serializer = FlightDetailSerializer(
+            [Flight.objects.get(id=id_) for id_ in ids], many=True
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(
+            response.data[1]["taken_places"], [{"row": 1, "seat": 1}]
+        )
+
+    def test_batch_flight_invalid_ids(self):
+        response = self.client.get(FLIGHT_URL, {"ids": "1,a"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_filter_flights_invalid_date_rejected(self):
+        response = self.client.get(FLIGHT_URL, {"date_from": "02.06.2024"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_flight_detail_expand_requires_ids(self):
+        response = self.client.get(FLIGHT_URL, {"expand": "detail"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_create_flight_forbidden(self):
         route = sample_route()
         airplane = sample_airplane()
@@ -253,6 +383,7 @@ class AuthorizedAirportApiTests(TestCase):
 
 class AdminAirportApiTest(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user = get_user_model().objects.create_user(
             email="admin@admin.com", password="admin123", is_staff=True
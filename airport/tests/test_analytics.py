@@ -0,0 +1,109 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from airport.jobs import run_pending
+from airport.models import RouteOccupancy
+from airport.tests.test_airport_api import (
+    sample_airplane,
+    sample_flight,
+    sample_route,
+)
+from airport.tests.test_order_api import sample_order
+
+OCCUPANCY_URL = reverse("airport:analytics-occupancy")
+TOP_ROUTES_URL = reverse("airport:analytics-top-routes")
+
+
+class AnalyticsApiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.admin = get_user_model().objects.create_superuser(
+            email="admin@test.com", password="test123"
+        )
+        self.client.force_authenticate(self.admin)
+        self.route = sample_route()
+        self.airplane = sample_airplane()
+        self.flights = [
+            sample_flight(
+                route=self.route,
+                airplane=self.airplane,
+                departure_time=f"2024-06-0{day}T14:00:00",
+                arrival_time=f"2024-06-0{day}T15:40:00",
+            )
+            for day in (2, 3)
+        ]
+        sample_order(self.admin, self.flights[0], [(1, 1), (1, 2)])
+        call_command("refresh_occupancy", stdout=StringIO())
+
+    def test_occupancy_per_day(self):
+        res = self.client.get(OCCUPANCY_URL, {"group_by": "day"})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(row["seats"], row["seats_sold"]) for row in res.data],
+            [(156, 2), (156, 0)],
+        )
+        self.assertEqual(res.data[0]["load_factor"], round(2 / 156, 4))
+
+    def test_occupancy_follows_booked_tickets(self):
+        sample_order(self.admin, self.flights[1], [(2, 1)])
+        run_pending()
+
+        res = self.client.get(
+            OCCUPANCY_URL,
+            {"group_by": "airplane_type", "date_from": "2024-06-03"},
+        )
+
+        self.assertEqual(len(res.data), 1)
+        self.assertEqual(res.data[0]["flights"], 1)
+        self.assertEqual(res.data[0]["seats_sold"], 1)
+
+    def test_top_routes(self):
+        res = self.client.get(TOP_ROUTES_URL, {"limit": 1})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data[0]["route_id"], self.route.id)
+        self.assertEqual(res.data[0]["flights"], 2)
+        self.assertEqual(res.data[0]["seats_sold"], 2)
+
+    def test_refresh_rebuilds_window_only(self):
+        RouteOccupancy.objects.update(seats_sold=0)
+
+        call_command(
+            "refresh_occupancy",
+            "--date-from=2024-06-02",
+            "--date-to=2024-06-02",
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(
+            list(
+                RouteOccupancy.objects.order_by("date").values_list(
+                    "seats_sold", flat=True
+                )
+            ),
+            [2, 0],
+        )
+
+    def test_invalid_group_by(self):
+        res = self.client.get(OCCUPANCY_URL, {"group_by": "city"})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_analytics_admin_only(self):
+        user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.client.force_authenticate(user)
+
+        res = self.client.get(OCCUPANCY_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,27 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework.views import APIView
+
+from airport.benchmark import generate_data, measure, scenarios
+from airport.models import Flight, Order
+
+
+class BenchmarkTests(TestCase):
+    def test_scenarios_run_on_generated_data(self):
+        cache.clear()
+        user = generate_data(cities=4, flights=20, orders=10)
+        client = APIClient()
+        client.force_authenticate(user)
+
+        self.assertEqual(Flight.objects.count(), 20)
+        self.assertEqual(Order.objects.count(), 10)
+
+        with mock.patch.object(APIView, "get_throttles", return_value=[]):
+            for name, requests in scenarios(3).items():
+                stats = measure(client, requests)
+
+                self.assertEqual(stats["requests"], 3, name)
+                self.assertGreater(stats["queries"], 0, name)
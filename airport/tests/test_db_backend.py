@@ -0,0 +1,133 @@
+from unittest import mock
+
+import psycopg2
+from django.test import SimpleTestCase
+from psycopg2 import extensions
+
+from airport.db_backend import base, stats
+
+
+def fake_connection(usable=True):
+    connection = mock.MagicMock(closed=False, isolation_level=None)
+    connection.info.transaction_status = extensions.TRANSACTION_STATUS_IDLE
+
+    if not usable:
+        connection.cursor.return_value.__enter__.return_value.execute = (
+            mock.Mock(side_effect=psycopg2.OperationalError)
+        )
+
+    return connection
+
+
+def events(alias):
+    return stats.snapshot()["databases"].get(alias, {})
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    alias = "pool-test"
+
+    def setUp(self):
+        patcher = mock.patch(
+            "psycopg2.connect", side_effect=lambda **kwargs: fake_connection()
+        )
+        self.connect = patcher.start()
+        self.addCleanup(patcher.stop)
+        stats._events.pop(self.alias, None)
+
+    def test_pool_reuses_idle_connections(self):
+        pool = base.ConnectionPool(self.alias, 1, 2)
+        connection = pool.getconn()
+        pool.putconn(connection)
+
+        self.assertIs(pool.getconn(), connection)
+        self.assertEqual(self.connect.call_count, 1)
+        self.assertEqual(events(self.alias)["opened"], 1)
+        self.assertEqual(events(self.alias)["pool_hits"], 2)
+
+    def test_pool_closes_connections_above_min_size(self):
+        pool = base.ConnectionPool(self.alias, 1, 2)
+        first, second = pool.getconn(), pool.getconn()
+        pool.putconn(first)
+        pool.putconn(second)
+
+        self.assertEqual(events(self.alias)["opened"], 2)
+        self.assertFalse(first.close.called)
+        self.assertTrue(second.close.called)
+        self.assertEqual(len(pool._pool), 1)
+
+
+class DatabaseWrapperTests(SimpleTestCase):
+    alias = "backend-test"
+
+    def setUp(self):
+        self.connections = []
+        patcher = mock.patch("psycopg2.connect", side_effect=self.connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("psycopg2.extras.register_default_jsonb")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        stats._events.pop(self.alias, None)
+        self.addCleanup(base._pools.clear)
+        self.addCleanup(stats._pools.pop, self.alias, None)
+
+    def connect(self, **kwargs):
+        connection = fake_connection(usable=len(self.connections) > 0)
+        self.connections.append(connection)
+
+        return connection
+
+    def wrapper(self, **settings):
+        return base.DatabaseWrapper(
+            {"OPTIONS": {}, "CONN_HEALTH_CHECKS": True, **settings},
+            self.alias,
+        )
+
+    def test_pooled_connection_checked_until_usable(self):
+        wrapper = self.wrapper(POOL={"MIN_SIZE": 1, "MAX_SIZE": 2})
+
+        connection = wrapper.get_new_connection({})
+
+        self.assertIs(connection, self.connections[1])
+        self.assertTrue(self.connections[0].close.called)
+        self.assertEqual(events(self.alias)["health_check_failures"], 1)
+        self.assertEqual(events(self.alias)["opened"], 2)
+
+    def test_close_returns_connection_to_pool(self):
+        wrapper = self.wrapper(POOL={"MIN_SIZE": 1, "MAX_SIZE": 2})
+        wrapper.connection = wrapper.get_new_connection({})
+
+        wrapper.close()
+
+        self.assertIsNone(wrapper.connection)
+        self.assertEqual(wrapper.pool._pool, [self.connections[1]])
+        self.assertFalse(self.connections[1].close.called)
+
+    def test_unusable_connection_closed_once_per_request(self):
+        wrapper = self.wrapper()
+        connection = wrapper.connection = fake_connection()
+
+        with mock.patch.object(wrapper, "is_usable", return_value=False):
+            wrapper.close_if_health_check_failed()
+
+        self.assertIsNone(wrapper.connection)
+        self.assertTrue(connection.close.called)
+        self.assertTrue(wrapper.health_check_done)
+        self.assertEqual(events(self.alias)["health_check_failures"], 1)
+
+        wrapper.connection = fake_connection()
+
+        with mock.patch.object(wrapper, "is_usable") as is_usable:
+            wrapper.close_if_health_check_failed()
+
+        self.assertFalse(is_usable.called)
+
+    def test_usable_connection_kept(self):
+        wrapper = self.wrapper()
+        connection = wrapper.connection = fake_connection()
+
+        with mock.patch.object(wrapper, "is_usable", return_value=True):
+            wrapper.close_if_health_check_failed()
+
+        self.assertIs(wrapper.connection, connection)
+        self.assertNotIn("health_check_failures", events(self.alias))
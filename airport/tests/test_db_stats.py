@@ -0,0 +1,47 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from airport.db_backend import stats
+
+DB_STATS_URL = reverse("airport:db-stats")
+
+
+class DatabaseStatsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def test_db_stats_admin_only(self):
+        user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.client.force_authenticate(user)
+
+        res = self.client.get(DB_STATS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_db_stats_counts_requests_and_connections(self):
+        admin = get_user_model().objects.create_superuser(
+            email="admin@test.com", password="test123"
+        )
+        self.client.force_authenticate(admin)
+        before = stats.snapshot()
+        stats.record(connection.alias, "connects")
+
+        res = self.client.get(DB_STATS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["requests"], before["requests"] + 1)
+        database = res.data["databases"][connection.alias]
+        self.assertEqual(
+            database["connects"],
+            before["databases"].get(connection.alias, {}).get("connects", 0)
+            + 1,
+        )
+        self.assertIsNotNone(database["reuse_ratio"])
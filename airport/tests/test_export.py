@@ -0,0 +1,72 @@
+import json
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from airport.models import Order
+from airport.tests.test_airport_api import sample_flight
+from airport.tests.test_order_api import sample_order
+
+EXPORT_URL = reverse("airport:order-export")
+
+
+class OrderExportTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="admin@admin.com", password="admin123", is_staff=True
+        )
+        self.client.force_authenticate(self.user)
+        flight = sample_flight()
+        self.order = sample_order(self.user, flight, [(1, 1), (1, 2)])
+        old_order = sample_order(self.user, flight, [(2, 1)])
+        Order.objects.filter(id=old_order.id).update(
+            created_at="2024-05-01T10:00:00"
+        )
+
+    def test_export_csv(self):
+        response = self.client.get(EXPORT_URL, {"date_from": "2024-05-02"})
+        lines = b"".join(response.streaming_content).decode().splitlines()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("order_id,order_created_at"))
+        self.assertTrue(lines[1].startswith(f"{self.order.id},"))
+
+    def test_export_invalid_date_rejected(self):
+        response = self.client.get(EXPORT_URL, {"date_to": "2024-13-01"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_forbidden_for_customers(self):
+        customer = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.client.force_authenticate(customer)
+
+        response = self.client.get(EXPORT_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_export_command_ndjson(self):
+        stdout = StringIO()
+
+        call_command(
+            "export_orders",
+            "--format=ndjson",
+            "--date-to=2024-05-01",
+            stdout=stdout,
+        )
+        rows = [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual((rows[0]["row"], rows[0]["seat"]), (2, 1))
+        self.assertEqual(rows[0]["user_email"], "admin@admin.com")
@@ -0,0 +1,70 @@
+from datetime import date, time, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from airport.models import Flight, FlightSchedule
+from airport.tests.test_airport_api import (
+    sample_airplane,
+    sample_crew,
+    sample_route,
+)
+
+
+class FlightScheduleTests(TestCase):
+    def setUp(self):
+        self.schedule = FlightSchedule.objects.create(
+            route=sample_route(),
+            airplane=sample_airplane(),
+            departure_time=time(7, 30),
+            duration=timedelta(hours=1, minutes=40),
+            weekdays="123456",
+            start_date=date(2024, 6, 3),
+        )
+        self.schedule.crew.add(sample_crew())
+
+    def test_generate_flights_skips_excluded_weekdays(self):
+        created = self.schedule.generate_flights(date(2024, 6, 16))
+        flights = Flight.objects.filter(schedule=self.schedule)
+
+        self.assertEqual(created, 12)
+        self.assertEqual(flights.count(), 12)
+        self.assertFalse(
+            flights.filter(departure_time__week_day=1).exists()
+        )
+        self.assertEqual(
+            str(flights.last().arrival_time), "2024-06-03 09:10:00"
+        )
+        self.assertEqual(
+            Flight.crew.through.objects.filter(
+                flight__schedule=self.schedule
+            ).count(),
+            12,
+        )
+
+    def test_generate_flights_is_idempotent(self):
+        self.schedule.generate_flights(date(2024, 6, 9))
+        FlightSchedule.objects.update(generated_until=None)
+        self.schedule.refresh_from_db()
+
+        created = self.schedule.generate_flights(date(2024, 6, 16))
+
+        self.assertEqual(created, 6)
+        self.assertEqual(
+            Flight.objects.filter(schedule=self.schedule).count(), 12
+        )
+
+    def test_generate_flights_command_extends_horizon(self):
+        call_command(
+            "generate_flights", "--until=2024-06-09", stdout=StringIO()
+        )
+        call_command(
+            "generate_flights", "--until=2024-06-16", stdout=StringIO()
+        )
+        self.schedule.refresh_from_db()
+
+        self.assertEqual(self.schedule.generated_until, date(2024, 6, 16))
+        self.assertEqual(
+            Flight.objects.filter(schedule=self.schedule).count(), 12
+        )
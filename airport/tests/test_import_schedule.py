@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from airport.models import Airport, Crew, Flight, Route
+from airport.tests.test_airport_api import sample_airplane
+
+CSV_HEADER = (
+    "source_airport,source_city,destination_airport,destination_city,"
+    "distance,airplane,departure_time,arrival_time,crew\n"
+)
+
+
+class ImportScheduleTests(TestCase):
+    def setUp(self):
+        self.airplane = sample_airplane(name="Airbus A318")
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+
+        with open(path, "w") as schedule:
+            schedule.write(content)
+
+        return path
+
+    def test_import_csv(self):
+        path = self.write(
+            "schedule.csv",
+            CSV_HEADER
+            + "KBP,Kyiv,LWO,Lviv,470,Airbus A318,"
+            "2024-06-02T08:00:00,2024-06-02T09:10:00,John Doe;Jane Doe\n"
+            "LWO,Lviv,KBP,Kyiv,470,Airbus A318,"
+            "2024-06-02T11:00:00,2024-06-02T12:10:00,John Doe\n"
+            "KBP,Kyiv,LWO,Lviv,470,Airbus A318,"
+            "2024-06-03T08:00:00,2024-06-03T09:10:00,\n",
+        )
+
+        call_command("import_schedule", path, chunk_size=2, stdout=StringIO())
+
+        self.assertEqual(Airport.objects.count(), 2)
+        self.assertEqual(Route.objects.count(), 2)
+        self.assertEqual(Crew.objects.count(), 2)
+        self.assertEqual(Flight.objects.count(), 3)
+        self.assertEqual(
+            Flight.objects.get(departure_time="2024-06-02T08:00:00")
+            .crew.count(),
+            2,
+        )
+        self.assertFalse(os.path.exists(f"{path}.checkpoint"))
+
+    def test_resume_jsonl_after_failed_chunk(self):
+        rows = [
+            {
+                "source_airport": "KBP",
+                "source_city": "Kyiv",
+                "destination_airport": "LWO",
+                "destination_city": "Lviv",
+                "distance": 470,
+                "airplane": airplane,
+                "departure_time": f"2024-06-0{day}T08:00:00",
+                "arrival_time": f"2024-06-0{day}T09:10:00",
+                "crew": ["John Doe"],
+            }
+            for day, airplane in (
+                (1, "Airbus A318"),
+                (2, "Airbus A318"),
+                (3, "Boeing 737"),
+            )
+        ]
+        path = self.write(
+            "schedule.jsonl", "\n".join(json.dumps(row) for row in rows)
+        )
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "import_schedule", path, chunk_size=2, stdout=StringIO()
+            )
+
+        self.assertEqual(Flight.objects.count(), 2)
+
+        sample_airplane(
+            name="Boeing 737", airplane_type=self.airplane.airplane_type
+        )
+        call_command(
+            "import_schedule",
+            path,
+            chunk_size=2,
+            resume=True,
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(Flight.objects.count(), 3)
@@ -0,0 +1,112 @@
+from datetime import datetime
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from airport.itineraries import find_itineraries, load_flight_graph
+from airport.models import Route
+from airport.tests.test_airport_api import (
+    sample_airplane,
+    sample_airport,
+    sample_city,
+    sample_flight,
+)
+
+ITINERARIES_URL = reverse("airport:flight-itineraries")
+
+
+class ItinerarySearchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.client.force_authenticate(self.user)
+
+        self.cities = {}
+        airports = {}
+
+        for name in ("Kharkiv", "Lviv", "Warsaw"):
+            self.cities[name] = sample_city(name=name)
+            airports[name] = sample_airport(
+                name=f"{name} Airport", closest_big_city=self.cities[name]
+            )
+
+        self.airplane = sample_airplane()
+        self.routes = {
+            (source, destination): Route.objects.create(
+                source=airports[source],
+                destination=airports[destination],
+                distance=500,
+            )
+            for source, destination in (
+                ("Kharkiv", "Lviv"),
+                ("Lviv", "Warsaw"),
+                ("Kharkiv", "Warsaw"),
+            )
+        }
+
+    def flight(self, source, destination, departure, arrival):
+        return sample_flight(
+            route=self.routes[(source, destination)],
+            airplane=self.airplane,
+            departure_time=departure,
+            arrival_time=arrival,
+        )
+
+    def test_itineraries_ranked_by_arrival(self):
+        leg_1 = self.flight(
+            "Kharkiv", "Lviv", "2024-06-02T08:00:00", "2024-06-02T09:40:00"
+        )
+        leg_2 = self.flight(
+            "Lviv", "Warsaw", "2024-06-02T11:00:00", "2024-06-02T12:10:00"
+        )
+        direct = self.flight(
+            "Kharkiv", "Warsaw", "2024-06-02T12:00:00", "2024-06-02T14:00:00"
+        )
+        # too short connection
+        self.flight(
+            "Lviv", "Warsaw", "2024-06-02T10:00:00", "2024-06-02T11:10:00"
+        )
+        date = datetime(2024, 6, 2)
+
+        itineraries = find_itineraries(
+            load_flight_graph(date),
+            self.cities["Kharkiv"].id,
+            self.cities["Warsaw"].id,
+            date,
+        )
+
+        self.assertEqual(itineraries, [[leg_1.id, leg_2.id], [direct.id]])
+
+    def test_itineraries_endpoint(self):
+        leg_1 = self.flight(
+            "Kharkiv", "Lviv", "2024-06-02T08:00:00", "2024-06-02T09:40:00"
+        )
+        leg_2 = self.flight(
+            "Lviv", "Warsaw", "2024-06-03T07:00:00", "2024-06-03T08:10:00"
+        )
+
+        response = self.client.get(
+            ITINERARIES_URL,
+            {
+                "from_city": self.cities["Kharkiv"].id,
+                "to_city": self.cities["Warsaw"].id,
+                "date": "2024-06-02",
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(
+            [flight["id"] for flight in response.data[0]["flights"]],
+            [leg_1.id, leg_2.id],
+        )
+        self.assertEqual(
+            response.data[0]["arrival_time"], "2024-06-03T08:10:00"
+        )
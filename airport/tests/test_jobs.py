@@ -0,0 +1,100 @@
+import json
+import os
+import tempfile
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from airport.jobs import enqueue, run_pending
+from airport.models import Job
+from airport.tests.test_airport_api import sample_flight
+from airport.tests.test_order_api import ORDER_URL
+
+
+def failing_task():
+    raise RuntimeError("Sink is down")
+
+
+class OrderConfirmationJobTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.client.force_authenticate(self.user)
+        self.flight = sample_flight()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_order_confirmation_queued_and_delivered(self):
+        payload = {
+            "tickets": [{"row": 1, "seat": 1, "flight": self.flight.id}]
+        }
+        sink = os.path.join(self.directory.name, "notifications.jsonl")
+
+        response = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(
+            Job.objects.filter(
+                task="airport.tasks.send_order_confirmation"
+            ).exists()
+        )
+
+        with override_settings(
+            CONFIRMATION_ROOT=self.directory.name, NOTIFICATION_SINK=sink
+        ):
+            self.assertEqual(run_pending(), (3, 0))
+
+        path = os.path.join(
+            self.directory.name, f"order-{response.data['id']}.json"
+        )
+
+        with open(path) as document:
+            self.assertEqual(json.load(document)["tickets"][0]["row"], 1)
+
+        with open(sink) as notifications:
+            notification = json.loads(notifications.readline())
+
+        self.assertEqual(notification["recipient"], "test@test.com")
+        self.assertEqual(notification["attachment"], path)
+        self.assertFalse(Job.objects.exists())
+
+
+class JobQueueTests(TestCase):
+    def run_failing(self):
+        with self.assertLogs("airport.jobs", "WARNING"):
+            return run_pending()
+
+    @override_settings(JOB_MAX_ATTEMPTS=2)
+    def test_failed_job_retried_then_dead(self):
+        job = enqueue(failing_task)
+
+        self.assertEqual(self.run_failing(), (0, 1))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.QUEUED)
+        self.assertEqual(job.attempts, 1)
+        self.assertGreater(job.run_at, timezone.now())
+
+        Job.objects.update(run_at=timezone.now())
+        self.assertEqual(self.run_failing(), (0, 1))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.DEAD)
+        self.assertIn("Sink is down", job.last_error)
+
+        self.assertEqual(run_pending(), (0, 0))
+
+    def test_stale_running_job_claimed_again(self):
+        enqueue(failing_task)
+        Job.objects.update(
+            status=Job.Status.RUNNING,
+            run_at=timezone.now() - timedelta(seconds=1),
+        )
+
+        self.assertEqual(self.run_failing(), (0, 1))
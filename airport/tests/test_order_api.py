@@ -0,0 +1,267 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from airport.models import Flight, Order, Ticket
+from airport.tests.test_airport_api import (
+    sample_airplane,
+    sample_crew,
+    sample_flight,
+    sample_route,
+)
+
+ORDER_URL = reverse("airport:order-list")
+
+
+def sample_order(user, flight, seats):
+    order = Order.objects.create(user=user)
+
+    for row, seat in seats:
+        Ticket.objects.create(order=order, flight=flight, row=row, seat=seat)
+
+    return order
+
+
+class OrderListQueryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.client.force_authenticate(self.user)
+
+        route = sample_route()
+        airplane = sample_airplane()
+        self.flights = [
+            sample_flight(
+                route=route,
+                airplane=airplane,
+                departure_time=f"2024-06-0{day}T14:00:00",
+                arrival_time=f"2024-06-0{day}T15:40:00",
+            )
+            for day in range(1, 4)
+        ]
+
+        for flight in self.flights:
+            flight.crew.add(
+                sample_crew(first_name="John", last_name=f"Doe {flight.id}")
+            )
+
+    def test_order_list_query_count_does_not_grow_with_tickets(self):
+        sample_order(self.user, self.flights[0], [(1, 1)])
+
+        # throttle counter, count, orders, tickets with flight graph, crew
+        with self.assertNumQueries(5):
+            response = self.client.get(ORDER_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        for flight in self.flights:
+            sample_order(
+                self.user, flight, [(row, 2) for row in range(2, 8)]
+            )
+
+        with self.assertNumQueries(5):
+            response = self.client.get(ORDER_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 4)
+
+    def test_order_list_only_returns_own_orders(self):
+        other_user = get_user_model().objects.create_user(
+            email="other@test.com", password="test123"
+        )
+        sample_order(other_user, self.flights[0], [(1, 1)])
+        own_order = sample_order(self.user, self.flights[1], [(1, 1)])
+
+        response = self.client.get(ORDER_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [order["id"] for order in response.data["results"]],
+            [own_order.id],
+        )
+
+
+class SeatsSoldCounterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.client.force_authenticate(self.user)
+        self.flight = sample_flight()
+
+    def test_create_order_increments_seats_sold(self):
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": self.flight.id},
+                {"row": 1, "seat": 2, "flight": self.flight.id},
+            ]
+        }
+
+        response = self.client.post(ORDER_URL, payload, format="json")
+        self.flight.refresh_from_db()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.flight.seats_sold, 2)
+        self.assertEqual(self.flight.seats_available, 26 * 6 - 2)
+
+    def test_delete_tickets_decrements_seats_sold(self):
+        order = sample_order(self.user, self.flight, [(1, 1), (1, 2)])
+
+        order.delete()
+        self.flight.refresh_from_db()
+
+        self.assertEqual(self.flight.seats_sold, 0)
+
+    def test_reconcile_seats_fixes_drift(self):
+        sample_order(self.user, self.flight, [(1, 1), (1, 2)])
+        Flight.objects.filter(id=self.flight.id).update(seats_sold=7)
+
+        call_command("reconcile_seats", stdout=StringIO())
+        self.flight.refresh_from_db()
+
+        self.assertEqual(self.flight.seats_sold, 2)
+
+    def test_reconcile_seats_leaves_new_flights(self):
+        stdout = StringIO()
+
+        call_command("reconcile_seats", stdout=stdout)
+
+        self.assertIn("Reconciled 0 flight(s)", stdout.getvalue())
+
+    def test_moving_ticket_moves_taken_seat(self):
+        order = sample_order(self.user, self.flight, [(1, 1)])
+        ticket = order.tickets.get()
+        ticket.seat = 2
+        ticket.save()
+        self.flight.refresh_from_db()
+        seat_map = self.flight.get_seat_map()
+
+        self.assertFalse(seat_map.is_taken(1, 1))
+        self.assertTrue(seat_map.is_taken(1, 2))
+        self.assertEqual(self.flight.seats_sold, 1)
+
+        response = self.client.post(
+            ORDER_URL,
+            {"tickets": [{"row": 1, "seat": 2, "flight": self.flight.id}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_moving_ticket_to_another_flight(self):
+        other_flight = sample_flight(
+            route=self.flight.route, airplane=self.flight.airplane
+        )
+        ticket = sample_order(self.user, self.flight, [(1, 1)]).tickets.get()
+        ticket.flight = other_flight
+        ticket.save()
+        self.flight.refresh_from_db()
+        other_flight.refresh_from_db()
+
+        self.assertEqual(self.flight.seats_sold, 0)
+        self.assertEqual(other_flight.seats_sold, 1)
+        self.assertTrue(other_flight.get_seat_map().is_taken(1, 1))
+
+
+class BulkOrderCreateTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.client.force_authenticate(self.user)
+        self.flight = sample_flight()
+
+    def test_create_order_tickets_in_bulk(self):
+        payload = {
+            "tickets": [
+                {"row": row, "seat": 1, "flight": self.flight.id}
+                for row in range(1, 11)
+            ]
+        }
+
+        # user and order create throttle counters, flights, then
+        # savepoint, locked flights, holds, order, tickets in their own
+        # savepoint, seat map, occupancy job, used holds, confirmation
+        # job, release savepoint and the response tickets
+        with self.assertNumQueries(16):
+            response = self.client.post(ORDER_URL, payload, format="json")
+
+        self.flight.refresh_from_db()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Ticket.objects.count(), 10)
+        self.assertEqual(self.flight.seats_sold, 10)
+
+    def test_duplicate_seats_reported_per_ticket(self):
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": self.flight.id},
+                {"row": 1, "seat": 2, "flight": self.flight.id},
+                {"row": 1, "seat": 1, "flight": self.flight.id},
+            ]
+        }
+
+        response = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["tickets"][:2], [{}, {}])
+        self.assertIn("seat", response.data["tickets"][2])
+        self.assertFalse(Order.objects.exists())
+
+    def test_seat_map_drift_reported_per_ticket(self):
+        # a ticket written without updating the seat map
+        Ticket.objects.bulk_create(
+            [
+                Ticket(
+                    order=Order.objects.create(user=self.user),
+                    flight=self.flight,
+                    row=1,
+                    seat=2,
+                )
+            ]
+        )
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": self.flight.id},
+                {"row": 1, "seat": 2, "flight": self.flight.id},
+            ]
+        }
+
+        response = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["tickets"][0], {})
+        self.assertEqual(
+            response.data["tickets"][1],
+            {"seat": ["seat 2 in row 1 is already taken"]},
+        )
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_invalid_tickets_reported_per_ticket(self):
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": self.flight.id},
+                {"row": 100, "seat": 1, "flight": self.flight.id},
+                {"row": 1, "seat": 1, "flight": self.flight.id + 1},
+            ]
+        }
+
+        response = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["tickets"][0], {})
+        self.assertIn("row", response.data["tickets"][1])
+        self.assertIn("flight", response.data["tickets"][2])
@@ -0,0 +1,83 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from airport.models import Order
+from airport.tests.test_airport_api import (
+    FLIGHT_URL,
+    sample_airplane,
+    sample_flight,
+    sample_route,
+)
+from airport.tests.test_order_api import ORDER_URL
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.client.force_authenticate(self.user)
+
+    def collect_pages(self, url, params):
+        ids = []
+        response = self.client.get(url, params)
+
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [item["id"] for item in response.data["results"]]
+
+            if response.data["next"] is None:
+                return ids
+
+            response = self.client.get(response.data["next"])
+
+    def test_flight_cursor_pages(self):
+        route = sample_route()
+        airplane = sample_airplane()
+        flights = [
+            sample_flight(
+                route=route,
+                airplane=airplane,
+                departure_time=f"2024-06-0{day}T14:00:00",
+                arrival_time=f"2024-06-0{day}T15:40:00",
+            )
+            for day in (1, 2, 2, 2, 3)
+        ]
+        expected = [flight.id for flight in flights[4:]]
+        expected += sorted(flight.id for flight in flights[1:4])
+        expected += [flights[0].id]
+
+        ids = self.collect_pages(FLIGHT_URL, {"cursor": "", "page_size": 2})
+
+        self.assertEqual(ids, expected)
+
+    def test_flight_list_without_cursor_is_not_paginated(self):
+        sample_flight()
+
+        response = self.client.get(FLIGHT_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+
+    def test_order_cursor_pages(self):
+        orders = [Order.objects.create(user=self.user) for _ in range(3)]
+        Order.objects.filter(id=orders[0].id).update(
+            created_at="2024-06-02T10:00:00"
+        )
+        Order.objects.filter(id__in=[orders[1].id, orders[2].id]).update(
+            created_at="2024-06-01T10:00:00"
+        )
+
+        ids = self.collect_pages(ORDER_URL, {"cursor": "", "page_size": 1})
+
+        self.assertEqual(ids, [orders[0].id, orders[1].id, orders[2].id])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(FLIGHT_URL, {"cursor": "not-a-cursor"})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
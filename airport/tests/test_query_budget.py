@@ -0,0 +1,92 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from airport.models import Flight
+from airport.tests.test_airport_api import (
+    FLIGHT_URL,
+    detail_url,
+    sample_airplane,
+    sample_crew,
+    sample_flight,
+    sample_route,
+)
+from airport.tests.test_order_api import ORDER_URL, sample_order
+from airport.tests.utils import assert_constant_queries
+from airport.views import FlightViewSet
+
+
+class QueryBudgetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.client.force_authenticate(self.user)
+        self.route = sample_route()
+        self.airplane = sample_airplane()
+        self.flight = self.add_flight()
+
+    def add_flight(self):
+        flight = sample_flight(route=self.route, airplane=self.airplane)
+        flight.crew.add(
+            sample_crew(first_name="John", last_name=f"Doe {flight.id}")
+        )
+
+        return flight
+
+    def add_order(self):
+        order_count = self.user.orders.count()
+        sample_order(self.user, self.add_flight(), [(order_count + 1, 1)])
+
+    def add_crew_and_tickets(self):
+        crew_count = self.flight.crew.count()
+        self.flight.crew.add(
+            sample_crew(first_name="Jane", last_name=f"Doe {crew_count}")
+        )
+        sample_order(self.user, self.flight, [(crew_count + 1, 2)])
+
+    def test_flight_list_queries_constant(self):
+        assert_constant_queries(
+            self, lambda: self.client.get(FLIGHT_URL), self.add_flight
+        )
+
+    def test_flight_detail_queries_constant(self):
+        assert_constant_queries(
+            self,
+            lambda: self.client.get(detail_url(self.flight.id)),
+            self.add_crew_and_tickets,
+        )
+
+    def test_flight_batch_detail_queries_constant(self):
+        def request():
+            ids = ",".join(str(flight.id) for flight in Flight.objects.all())
+            self.client.get(FLIGHT_URL, {"ids": ids, "expand": "detail"})
+
+        def grow():
+            self.add_crew_and_tickets()
+            self.flight = self.add_flight()
+
+        assert_constant_queries(self, request, grow)
+
+    def test_order_list_queries_constant(self):
+        self.add_order()
+
+        assert_constant_queries(
+            self, lambda: self.client.get(ORDER_URL), self.add_order
+        )
+
+    def test_over_budget_request_logged(self):
+        with mock.patch.object(FlightViewSet, "query_budget", {"list": 0}):
+            with self.assertLogs("airport.query_budget", "WARNING") as logs:
+                self.client.get(FLIGHT_URL)
+
+        self.assertIn("(list) ran 3 queries", logs.output[0])
+
+    def test_within_budget_request_not_logged(self):
+        with self.assertNoLogs("airport.query_budget", "WARNING"):
+            self.client.get(FLIGHT_URL)
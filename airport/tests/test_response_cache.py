@@ -0,0 +1,86 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from airport.tests.test_airport_api import (
+    AIRPORT_URL,
+    sample_airport,
+    sample_city,
+)
+
+CITY_URL = reverse("airport:city-list")
+
+
+class CachedListTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.client.force_authenticate(self.user)
+
+    def test_cached_list_skips_database(self):
+        sample_city()
+        self.client.get(CITY_URL)
+
+        # only the throttle counter
+        with self.assertNumQueries(1):
+            response = self.client.get(CITY_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+
+    def test_if_none_match_returns_not_modified(self):
+        sample_city()
+        etag = self.client.get(CITY_URL)["ETag"]
+
+        response = self.client.get(CITY_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_save_invalidates_dependent_lists(self):
+        city = sample_city()
+        sample_airport(closest_big_city=city)
+        etag = self.client.get(AIRPORT_URL)["ETag"]
+
+        city.name = "Kyiv-City"
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            city.save()
+
+        # not committed yet, the old version is still current
+        response = self.client.get(AIRPORT_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        for callback in callbacks:
+            callback()
+
+        response = self.client.get(AIRPORT_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["closest_big_city"], "Kyiv-City")
+
+    def test_query_params_cached_separately(self):
+        sample_airport()
+
+        response_1 = self.client.get(AIRPORT_URL, {"name": "Kyiv"})
+        response_2 = self.client.get(AIRPORT_URL, {"name": "Lviv"})
+
+        self.assertEqual(len(response_1.data), 1)
+        self.assertEqual(len(response_2.data), 0)
+        self.assertNotEqual(response_1["ETag"], response_2["ETag"])
+
+    def test_unauthenticated_request_not_served_from_cache(self):
+        self.client.get(CITY_URL)
+        self.client.force_authenticate(None)
+
+        response = self.client.get(CITY_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,129 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from airport.models import SeatHold, Ticket
+from airport.tests.test_airport_api import sample_flight
+from airport.tests.test_order_api import ORDER_URL
+
+
+def holds_url(flight_id):
+    return reverse("airport:flight-holds", args=[flight_id])
+
+
+class SeatHoldApiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.other_user = get_user_model().objects.create_user(
+            email="other@test.com", password="test123"
+        )
+        self.client.force_authenticate(self.user)
+        self.flight = sample_flight()
+
+    def hold(self, user, seats):
+        self.client.force_authenticate(user)
+
+        return self.client.post(
+            holds_url(self.flight.id),
+            [{"row": row, "seat": seat} for row, seat in seats],
+            format="json",
+        )
+
+    def test_hold_seats(self):
+        response = self.hold(self.user, [(1, 1), (1, 2)])
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(
+            SeatHold.objects.filter(user=self.user).count(), 2
+        )
+
+    def test_hold_seat_held_by_other_user_rejected(self):
+        self.hold(self.other_user, [(1, 2)])
+
+        response = self.hold(self.user, [(1, 1), (1, 2)])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn("seat", response.data[1])
+        self.assertFalse(SeatHold.objects.filter(user=self.user).exists())
+
+    def test_hold_no_seats_rejected(self):
+        response = self.hold(self.user, [])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_hold_same_seat_twice_rejected(self):
+        response = self.hold(self.user, [(1, 1), (1, 2), (1, 1)])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[:2], [{}, {}])
+        self.assertIn("seat", response.data[2])
+        self.assertFalse(SeatHold.objects.exists())
+
+    def test_expired_hold_can_be_taken_over(self):
+        self.hold(self.other_user, [(1, 2)])
+        SeatHold.objects.update(expires_at=timezone.now())
+
+        response = self.hold(self.user, [(1, 2)])
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_order_on_seat_held_by_other_user_rejected(self):
+        self.hold(self.other_user, [(1, 2)])
+        self.client.force_authenticate(self.user)
+
+        response = self.client.post(
+            ORDER_URL,
+            {"tickets": [{"row": 1, "seat": 2, "flight": self.flight.id}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Ticket.objects.exists())
+
+    def test_order_turns_own_hold_into_ticket(self):
+        self.hold(self.user, [(1, 2), (1, 3)])
+
+        response = self.client.post(
+            ORDER_URL,
+            {"tickets": [{"row": 1, "seat": 2, "flight": self.flight.id}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            list(SeatHold.objects.values_list("row", "seat")), [(1, 3)]
+        )
+
+    def test_release_holds(self):
+        self.hold(self.user, [(1, 2)])
+
+        response = self.client.delete(holds_url(self.flight.id))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(SeatHold.objects.exists())
+
+    def test_release_expired_holds_command(self):
+        self.hold(self.user, [(1, 2), (1, 3)])
+        SeatHold.objects.filter(seat=2).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        call_command("release_expired_holds", stdout=StringIO())
+
+        self.assertEqual(
+            list(SeatHold.objects.values_list("row", "seat")), [(1, 3)]
+        )
@@ -0,0 +1,102 @@
+import base64
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from airport.seat_map import SeatMap
+from airport.tests.test_airport_api import (
+    detail_url,
+    sample_airplane,
+    sample_flight,
+)
+from airport.tests.test_order_api import ORDER_URL, sample_order
+
+
+class SeatMapTests(SimpleTestCase):
+    def test_take_and_release(self):
+        seat_map = SeatMap(3, 4)
+
+        seat_map.take(2, 3)
+
+        self.assertTrue(seat_map.is_taken(2, 3))
+        self.assertFalse(seat_map.is_taken(3, 2))
+
+        seat_map.release(2, 3)
+
+        self.assertFalse(seat_map.is_taken(2, 3))
+
+    def test_encodings(self):
+        seat_map = SeatMap(2, 5)
+        seat_map.take(1, 1)
+        seat_map.take(1, 2)
+        seat_map.take(2, 5)
+
+        self.assertEqual(len(seat_map.to_bytes()), 2)
+        self.assertEqual(
+            base64.b64decode(seat_map.to_base64()), b"\xc0\x40"
+        )
+        self.assertEqual(seat_map.to_run_lengths(), [0, 2, 7, 1])
+
+    def test_resizes_stored_data(self):
+        seat_map = SeatMap(2, 8, b"\xff")
+
+        self.assertEqual(seat_map.to_bytes(), b"\xff\x00")
+
+
+class FlightSeatMapApiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.client.force_authenticate(self.user)
+        self.flight = sample_flight(
+            airplane=sample_airplane(rows=2, seats_in_row=4)
+        )
+
+    def test_tickets_update_seat_map(self):
+        order = sample_order(self.user, self.flight, [(1, 2), (2, 4)])
+        self.flight.refresh_from_db()
+
+        seat_map = self.flight.get_seat_map()
+        self.assertTrue(seat_map.is_taken(1, 2))
+        self.assertTrue(seat_map.is_taken(2, 4))
+
+        order.delete()
+        self.flight.refresh_from_db()
+
+        self.assertEqual(self.flight.get_seat_map().to_bytes(), b"\0")
+
+    def test_retrieve_flight_with_run_length_seat_map(self):
+        sample_order(self.user, self.flight, [(1, 2), (1, 3)])
+
+        response = self.client.get(
+            detail_url(self.flight.id), {"seat_map": "rle"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("taken_places", response.data)
+        self.assertEqual(
+            response.data["seat_map"],
+            {
+                "encoding": "rle",
+                "rows": 2,
+                "seats_in_row": 4,
+                "data": [1, 2, 5],
+            },
+        )
+
+    def test_book_taken_seat_rejected(self):
+        sample_order(self.user, self.flight, [(1, 2)])
+        payload = {
+            "tickets": [{"row": 1, "seat": 2, "flight": self.flight.id}]
+        }
+
+        response = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("seat", response.data["tickets"][0])
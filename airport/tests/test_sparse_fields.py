@@ -0,0 +1,120 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from airport.sparse_fields import parse_field_tree
+from airport.tests.test_airport_api import (
+    FLIGHT_URL,
+    detail_url,
+    sample_crew,
+    sample_flight,
+)
+from airport.tests.test_order_api import ORDER_URL, sample_order
+
+
+class ParseFieldTreeTests(SimpleTestCase):
+    def test_parse_field_tree(self):
+        self.assertEqual(
+            parse_field_tree("id, tickets.row,tickets.flight.route,,"),
+            {"id": {}, "tickets": {"row": {}, "flight": {"route": {}}}},
+        )
+
+
+class SparseFieldsApiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.client.force_authenticate(self.user)
+        self.flight = sample_flight()
+        self.flight.crew.add(sample_crew())
+        sample_order(self.user, self.flight, [(1, 1)])
+
+    def get(self, url, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response, queries
+
+    def test_flight_fields_prune_joins(self):
+        _, full_queries = self.get(FLIGHT_URL, {})
+        response, queries = self.get(
+            FLIGHT_URL, {"fields": "id,departure_time"}
+        )
+
+        self.assertEqual(set(response.data[0]), {"id", "departure_time"})
+        self.assertEqual(len(queries), len(full_queries) - 1)
+        self.assertNotIn("JOIN", queries[-1]["sql"])
+
+    def test_flight_expand(self):
+        response, _ = self.get(
+            FLIGHT_URL, {"expand": "route,crew,taken_places"}
+        )
+        flight = response.data[0]
+
+        self.assertEqual(flight["route"]["source"], "Kharkiv International Airport")
+        self.assertEqual(flight["crew"][0]["full_name"], "John Doe")
+        self.assertEqual(flight["taken_places"], [{"row": 1, "seat": 1}])
+
+    def test_unknown_field_rejected(self):
+        for params in (
+            {"fields": "id,price"},
+            {"expand": "price"},
+            {"expand": "route.price"},
+            {"fields": "crew.first_name"},
+        ):
+            response = self.client.get(FLIGHT_URL, params)
+
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST, params
+            )
+
+    def test_expanded_crew_fields(self):
+        response, _ = self.get(
+            FLIGHT_URL, {"expand": "crew", "fields": "crew.first_name"}
+        )
+
+        self.assertEqual(response.data, [{"crew": [{"first_name": "John"}]}])
+
+    def test_detail_loads_ticket_seats_only(self):
+        response, queries = self.get(detail_url(self.flight.id), {})
+
+        self.assertEqual(response.data["taken_places"], [{"row": 1, "seat": 1}])
+        ticket_query = next(
+            query["sql"]
+            for query in queries
+            if 'FROM "airport_ticket"' in query["sql"]
+        )
+        self.assertNotIn("order_id", ticket_query)
+
+    def test_order_nested_fields(self):
+        _, full_queries = self.get(ORDER_URL, {})
+        response, queries = self.get(
+            ORDER_URL, {"fields": "id,tickets.row,tickets.seat"}
+        )
+
+        self.assertEqual(
+            response.data["results"][0]["tickets"], [{"row": 1, "seat": 1}]
+        )
+        self.assertEqual(len(queries), len(full_queries) - 1)
+
+    def test_order_expand_ticket_flight_route(self):
+        response, _ = self.get(
+            ORDER_URL,
+            {"fields": "tickets.flight.route", "expand": "tickets.flight.route"},
+        )
+
+        self.assertEqual(
+            response.data["results"][0]["tickets"][0]["flight"]["route"][
+                "destination"
+            ],
+            "Lviv Danylo Halytskyi International Airport",
+        )
@@ -0,0 +1,80 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from airport.tests.test_airport_api import FLIGHT_SEARCH_URL, FLIGHT_URL
+from airport.throttling import (
+    ActionRateThrottle,
+    DatabaseThrottleStore,
+    SQLiteThrottleStore,
+    sliding_window,
+)
+
+
+class SlidingWindowTests(SimpleTestCase):
+    def test_previous_period_weighted_by_remaining_part(self):
+        self.assertEqual(sliding_window(5, 10, 10, 60, 0.5), (True, None))
+        self.assertEqual(sliding_window(6, 10, 10, 60, 0.5), (False, 6))
+
+    def test_over_limit_in_current_period_waits_for_next(self):
+        self.assertEqual(sliding_window(11, 0, 10, 60, 0.75), (False, 15))
+
+
+class ThrottleStoreTests(TestCase):
+    def assert_hits(self, store):
+        results = [store.hit("key", 2, 60, 30) for _ in range(4)]
+
+        self.assertEqual(
+            [allowed for allowed, _ in results], [True, True, False, False]
+        )
+        # half of the previous period, capped at 3, still counts
+        self.assertEqual(store.hit("key", 2, 60, 90), (False, 10))
+        self.assertEqual(store.hit("key", 2, 60, 150), (True, None))
+
+    def test_database_store(self):
+        self.assert_hits(DatabaseThrottleStore("default"))
+
+    def test_sqlite_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = SQLiteThrottleStore(os.path.join(directory, "db"))
+            self.assert_hits(store)
+            store.purge(10**10)
+
+            self.assertEqual(store.hit("key", 2, 60, 30), (True, None))
+            store.connection.close()
+
+
+class ActionRateThrottleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.client.force_authenticate(self.user)
+
+    @mock.patch.object(
+        ActionRateThrottle, "THROTTLE_RATES", {"flight_search": "2/hour"}
+    )
+    def test_flight_search_throttled_by_scope(self):
+        params = {"from_city": 1, "to_city": 2}
+
+        for _ in range(2):
+            response = self.client.get(FLIGHT_SEARCH_URL, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(FLIGHT_SEARCH_URL, params)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_429_TOO_MANY_REQUESTS
+        )
+
+        response = self.client.get(FLIGHT_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,113 @@
+from datetime import datetime
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from airport.models import Flight, Route
+from airport.serializers import FlightListSerializer, RouteListSerializer
+from airport.tests.test_airport_api import (
+    FLIGHT_URL,
+    ROUTE_URL,
+    sample_airplane,
+    sample_airport,
+    sample_crew,
+    sample_flight,
+    sample_route,
+)
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+class ValuesSerializerTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.client.force_authenticate(self.user)
+
+        route = sample_route()
+        airplane = sample_airplane()
+        crew = [
+            sample_crew(first_name=f"First {number}", last_name="Last")
+            for number in range(3)
+        ]
+        sample_flight(route=route, airplane=airplane).crew.add(
+            crew[2], crew[0]
+        )
+        flight = sample_flight(
+            route=route,
+            airplane=sample_airplane(
+                name="Boeing 737",
+                rows=30,
+                airplane_type=airplane.airplane_type,
+            ),
+            departure_time=datetime(2024, 6, 3, 9, 5, 30, 123456),
+            arrival_time=datetime(2024, 6, 3, 11, 0),
+        )
+        flight.crew.add(crew[1])
+        flight.seats_sold = 7
+        flight.save()
+        sample_flight(
+            route=Route.objects.create(
+                source=route.destination,
+                destination=sample_airport(
+                    name="Odesa Airport",
+                    closest_big_city=route.source.closest_big_city,
+                ),
+                distance=640,
+            ),
+            airplane=airplane,
+            departure_time=datetime(2024, 6, 1, 6, 0),
+        )
+
+    def test_flight_list_matches_model_serializer(self):
+        response = self.client.get(FLIGHT_URL)
+        serializer = FlightListSerializer(
+            Flight.objects.prefetch_related("crew"), many=True
+        )
+
+        self.assertEqual(response.content, render(serializer.data))
+
+    def test_flight_list_filtered_matches_model_serializer(self):
+        response = self.client.get(FLIGHT_URL, {"date": "2024-06-03"})
+        serializer = FlightListSerializer(
+            Flight.objects.filter(departure_time__date="2024-06-03"),
+            many=True,
+        )
+
+        self.assertEqual(response.content, render(serializer.data))
+
+    def test_flight_cursor_pages_match_model_serializer(self):
+        flights = Flight.objects.order_by("-departure_time", "id")
+        response = self.client.get(FLIGHT_URL, {"cursor": "", "page_size": 2})
+
+        self.assertEqual(
+            render(response.data["results"]),
+            render(FlightListSerializer(flights[:2], many=True).data),
+        )
+
+        response = self.client.get(response.data["next"])
+
+        self.assertEqual(
+            render(response.data["results"]),
+            render(FlightListSerializer(flights[2:], many=True).data),
+        )
+        self.assertIsNone(response.data["next"])
+
+    def test_route_list_matches_model_serializer(self):
+        response = self.client.get(ROUTE_URL)
+        serializer = RouteListSerializer(Route.objects.all(), many=True)
+
+        self.assertEqual(response.content, render(serializer.data))
+
+    def test_sparse_flight_list_uses_model_serializer(self):
+        response = self.client.get(FLIGHT_URL, {"fields": "id,crew"})
+
+        self.assertEqual(set(response.data[0]), {"id", "crew"})
@@ -0,0 +1,23 @@
+from django.db import connections
+
+from airport.query_budget import QueryCounter
+
+
+def assert_constant_queries(test_case, request, grow, times=2):
+    """Fail if ``request()`` runs more queries after ``grow()`` adds rows"""
+    counts = []
+
+    for _ in range(times + 1):
+        counter = QueryCounter()
+
+        with connections["default"].execute_wrapper(counter):
+            request()
+
+        counts.append(counter.count)
+        grow()
+
+    test_case.assertEqual(
+        len(set(counts)),
+        1,
+        f"Query count grows with the result size: {counts}",
+    )
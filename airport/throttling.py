@@ -0,0 +1,201 @@
+import math
+import sqlite3
+import threading
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connections
+from django.utils.module_loading import import_string
+from rest_framework import throttling
+
+from airport.models import ThrottleCounter
+
+TABLE = ThrottleCounter._meta.db_table
+
+# one statement per request: start the row, count in the current
+# period, or roll the current period over into the previous one;
+# the count stops at limit + 1 so rejected requests cannot pile up
+HIT_SQL = f"""
+    INSERT INTO {TABLE} (key, period, count, previous_count, expires)
+    VALUES (%s, %s, 1, 0, %s)
+    ON CONFLICT (key) DO UPDATE SET
+        previous_count = CASE
+            WHEN {TABLE}.period = excluded.period
+                THEN {TABLE}.previous_count
+            WHEN {TABLE}.period = excluded.period - 1
+                THEN {TABLE}.count
+            ELSE 0
+        END,
+        count = CASE
+            WHEN {TABLE}.period != excluded.period THEN 1
+            WHEN {TABLE}.count > %s THEN {TABLE}.count
+            ELSE {TABLE}.count + 1
+        END,
+        period = excluded.period,
+        expires = excluded.expires
+    RETURNING count, previous_count
+"""
+
+PURGE_SQL = f"DELETE FROM {TABLE} WHERE expires < %s"
+
+
+class DatabaseThrottleStore:
+    """Throttle counters in the table of the ThrottleCounter model.
+
+    The location is the alias of the database holding the table.
+    """
+
+    def __init__(self, location):
+        self.alias = location or "default"
+
+    def execute(self, sql, params):
+        with connections[self.alias].cursor() as cursor:
+            cursor.execute(sql, params)
+
+            return cursor.fetchone() if cursor.description else None
+
+    def hit(self, key, limit, duration, now):
+        """Count a request, return whether it is allowed and the wait"""
+        period = int(now // duration)
+        count, previous_count = self.execute(
+            HIT_SQL, [key, period, (period + 2) * duration, limit]
+        )
+
+        return sliding_window(
+            count, previous_count, limit, duration, now / duration - period
+        )
+
+    def purge(self, now):
+        self.execute(PURGE_SQL, [int(now)])
+
+
+class SQLiteThrottleStore(DatabaseThrottleStore):
+    """Throttle counters in a SQLite file shared by local workers.
+
+    The location is the path of the file, created if missing.
+    """
+
+    def __init__(self, location):
+        self.path = location
+        self.local = threading.local()
+
+    @property
+    def connection(self):
+        if not hasattr(self.local, "connection"):
+            self.local.connection = sqlite3.connect(
+                self.path, timeout=5, isolation_level=None
+            )
+            self.local.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {TABLE} ("
+                "key varchar(255) PRIMARY KEY, period bigint, "
+                "count integer, previous_count integer, expires bigint)"
+            )
+
+        return self.local.connection
+
+    def execute(self, sql, params):
+        return self.connection.execute(
+            sql.replace("%s", "?"), params
+        ).fetchone()
+
+
+def sliding_window(count, previous_count, limit, duration, elapsed):
+    """Weight the previous period into the current one.
+
+    ``elapsed`` is the part of the current period already gone.
+    Return whether the estimated count is within the limit and, if
+    not, the seconds to wait until it is.
+    """
+    if previous_count * (1 - elapsed) + count <= limit:
+        return True, None
+
+    if count > limit:
+        return False, math.ceil((1 - elapsed) * duration)
+
+    # wait for the previous period to weigh in less
+    needed = 1 - (limit - count) / previous_count
+
+    return False, math.ceil(round((needed - elapsed) * duration, 6))
+
+
+@lru_cache(maxsize=None)
+def get_store(backend, location):
+    return import_string(backend)(location)
+
+
+class SlidingWindowThrottleMixin:
+    """Keep throttle counts in the shared THROTTLE_BACKEND store.
+
+    Unlike the cache-based DRF throttles, which keep the timestamp of
+    every request, a key is one row updated in a single statement.
+    """
+
+    wait_seconds = None
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+
+        if self.key is None:
+            return True
+
+        store = get_store(
+            settings.THROTTLE_BACKEND, settings.THROTTLE_LOCATION
+        )
+        allowed, self.wait_seconds = store.hit(
+            self.key, self.num_requests, self.duration, self.timer()
+        )
+
+        return allowed
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class AnonRateThrottle(
+    SlidingWindowThrottleMixin, throttling.AnonRateThrottle
+):
+    pass
+
+
+class UserRateThrottle(
+    SlidingWindowThrottleMixin, throttling.UserRateThrottle
+):
+    pass
+
+
+class ActionRateThrottle(
+    SlidingWindowThrottleMixin, throttling.SimpleRateThrottle
+):
+    """Limit the actions listed in the ``throttle_scopes`` of a view.
+
+    ``throttle_scopes`` maps action names to scopes of
+    DEFAULT_THROTTLE_RATES. Users are limited by id, anonymous
+    clients by IP address.
+    """
+
+    def __init__(self):
+        # the rate depends on the view, see allow_request
+        self.rate = None
+
+    def allow_request(self, request, view):
+        scopes = getattr(view, "throttle_scopes", {})
+        self.scope = scopes.get(getattr(view, "action", None))
+
+        if not self.scope:
+            return True
+
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+
+        return super().allow_request(request, view)
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+
+        return self.cache_format % {"scope": self.scope, "ident": ident}
@@ -10,6 +10,8 @@ from airport.views import (
     RouteViewSet,
     FlightViewSet,
     OrderViewSet,
+    AnalyticsViewSet,
+    DatabaseStatsView,
 )
 
 router = routers.DefaultRouter()
@@ -21,7 +23,11 @@ router.register("airplanes", AirplaneViewSet)
 router.register("routes", RouteViewSet)
 router.register("flights", FlightViewSet)
 router.register("orders", OrderViewSet)
+router.register("analytics", AnalyticsViewSet, basename="analytics")
 
-urlpatterns = [path("", include(router.urls))]
+urlpatterns = [
+    path("", include(router.urls)),
+    path("db_stats/", DatabaseStatsView.as_view(), name="db-stats"),
+]
 
 app_name = "airport"
@@ -0,0 +1,136 @@
+from collections import defaultdict
+
+from rest_framework import serializers
+from rest_framework.response import Response
+
+from airport.models import Flight
+
+
+class ValuesSerializer:
+    """Render rows fetched with ``.values()`` for a read-only list.
+
+    Model serializers bind and run a field object for every value of
+    every row. Here the queryset fetches only the ``values`` lookups
+    and ``to_representation`` builds each dict directly. The output
+    must stay identical to the model serializer the view uses for the
+    same action, key order included.
+    """
+
+    values = ()
+
+    # shared so that datetimes are formatted as DateTimeField does
+    datetime_field = serializers.DateTimeField()
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    @classmethod
+    def get_rows(cls, queryset):
+        return queryset.prefetch_related(None).values(*cls.values)
+
+    def to_representation(self, row):
+        raise NotImplementedError
+
+    @property
+    def data(self):
+        return [self.to_representation(row) for row in self.rows]
+
+
+class RouteValuesSerializer(ValuesSerializer):
+    """Same output as RouteListSerializer"""
+
+    values = ("id", "source__name", "destination__name", "distance")
+
+    def to_representation(self, row):
+        return {
+            "id": row["id"],
+            "source": row["source__name"],
+            "destination": row["destination__name"],
+            "distance": row["distance"],
+        }
+
+
+class FlightValuesSerializer(ValuesSerializer):
+    """Same output as FlightListSerializer.
+
+    Crew names are read for all rows at once from the crew table
+    joined to the flight crew table, in the Crew ordering.
+    """
+
+    values = (
+        "id",
+        "route__source__name",
+        "route__destination__name",
+        "airplane__name",
+        "departure_time",
+        "arrival_time",
+        "airplane__rows",
+        "airplane__seats_in_row",
+        "seats_sold",
+    )
+
+    @property
+    def data(self):
+        self.rows = list(self.rows)
+        self.crew = defaultdict(list)
+        members = (
+            Flight.crew.through.objects.filter(
+                flight_id__in=[row["id"] for row in self.rows]
+            )
+            .order_by("crew_id")
+            .values_list("flight_id", "crew__first_name", "crew__last_name")
+        )
+
+        for flight_id, first_name, last_name in members:
+            self.crew[flight_id].append(f"{first_name} {last_name}")
+
+        return super().data
+
+    def to_representation(self, row):
+        to_datetime = self.datetime_field.to_representation
+
+        return {
+            "id": row["id"],
+            "route": (
+                f"{row['route__source__name']} -> "
+                f"{row['route__destination__name']}"
+            ),
+            "airplane": row["airplane__name"],
+            "departure_time": to_datetime(row["departure_time"]),
+            "arrival_time": to_datetime(row["arrival_time"]),
+            "crew": self.crew[row["id"]],
+            "tickets_available": (
+                row["airplane__rows"] * row["airplane__seats_in_row"]
+                - row["seats_sold"]
+            ),
+        }
+
+
+class ValuesListMixin:
+    """Serve the list action with ``values_serializer_class``.
+
+    Views fall back to their model serializer when
+    ``use_values_serializer`` is false, e.g. for options changing the
+    output.
+    """
+
+    values_serializer_class = None
+
+    def use_values_serializer(self):
+        return self.values_serializer_class is not None
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_values_serializer():
+            return super().list(request, *args, **kwargs)
+
+        rows = self.values_serializer_class.get_rows(
+            self.filter_queryset(self.get_queryset())
+        )
+        page = self.paginate_queryset(rows)
+
+        if page is not None:
+            return self.get_paginated_response(
+                self.values_serializer_class(page).data
+            )
+
+        return Response(self.values_serializer_class(rows).data)
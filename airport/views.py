@@ -1,9 +1,20 @@
-from datetime import datetime
-from django.db.models import F, Count
+from datetime import datetime, timedelta
+from django.db.models import F, Prefetch
+from django.http import StreamingHttpResponse
+from django.utils.functional import cached_property
 from drf_spectacular.types import OpenApiTypes
-from drf_spectacular.utils import extend_schema, OpenApiParameter
-from rest_framework import mixins, viewsets
+from drf_spectacular.utils import (
+    extend_schema,
+    inline_serializer,
+    OpenApiParameter,
+)
+from rest_framework import mixins, serializers, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.views import APIView
 from rest_framework.viewsets import GenericViewSet
 from airport.models import (
     AirplaneType,
@@ -14,8 +25,27 @@ from airport.models import (
     Route,
     Flight,
     Order,
+    Ticket,
+    SeatHold,
 )
+from airport.analytics import OCCUPANCY_GROUPS, occupancy, top_routes
+from airport.db_backend import stats as db_stats
+from airport.exports import EXPORT_FORMATS, export_rows
+from airport.idempotency import IdempotentCreateMixin
+from airport.itineraries import search_itineraries
+from airport.pagination import KeysetPagination
 from airport.permissions import IsAdminOrIfAuthenticatedReadOnly
+from airport.response_cache import CachedListMixin
+from airport.sparse_fields import (
+    SparseFieldsViewMixin,
+    apply_query_plan,
+    parse_field_tree,
+)
+from airport.values_serializers import (
+    FlightValuesSerializer,
+    RouteValuesSerializer,
+    ValuesListMixin,
+)
 from airport.serializers import (
     AirplaneTypeSerializer,
     CitySerializer,
@@ -28,13 +58,31 @@ from airport.serializers import (
     RouteSerializer,
     FlightListSerializer,
     FlightDetailSerializer,
+    ItinerarySerializer,
+    FlightSeatMapDetailSerializer,
     FlightSerializer,
     OrderSerializer,
     OrderListSerializer,
+    SeatHoldSerializer,
 )
 
+SEAT_MAP_ENCODINGS = ("base64", "rle")
+
+MAX_BATCH_IDS = 100
+
+
+def parse_dates(*values):
+    """Parse YYYY-MM-DD query parameters, empty ones are kept as is"""
+    try:
+        return [
+            value and datetime.strptime(value, "%Y-%m-%d") for value in values
+        ]
+    except ValueError:
+        raise ValidationError("Dates must be in the YYYY-MM-DD format")
+
 
 class AirplaneTypeViewSet(
+    CachedListMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     GenericViewSet,
@@ -42,9 +90,12 @@ class AirplaneTypeViewSet(
     queryset = AirplaneType.objects.all()
     serializer_class = AirplaneTypeSerializer
     permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+    cache_models = (AirplaneType,)
+    query_budget = {"list": 3}
 
 
 class CityViewSet(
+    CachedListMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     GenericViewSet,
@@ -52,9 +103,12 @@ class CityViewSet(
     queryset = City.objects.all()
     serializer_class = CitySerializer
     permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+    cache_models = (City,)
+    query_budget = {"list": 3}
 
 
 class CrewViewSet(
+    CachedListMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     GenericViewSet,
@@ -62,21 +116,26 @@ class CrewViewSet(
     queryset = Crew.objects.all()
     serializer_class = CrewSerializer
     permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+    cache_models = (Crew,)
+    query_budget = {"list": 3}
 
 
 class AirportViewSet(
+    CachedListMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     GenericViewSet,
 ):
     queryset = Airport.objects.select_related("closest_big_city")
     permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+    cache_models = (Airport, City)
+    query_budget = {"list": 3}
 
     def get_queryset(self):
         name = self.request.query_params.get("name")
         city_id = self.request.query_params.get("city")
 
-        queryset = self.queryset
+        queryset = self.queryset.all()
 
         if name:
             queryset = queryset.filter(name__icontains=name)
@@ -111,12 +170,15 @@ class AirportViewSet(
 
 
 class AirplaneViewSet(
+    CachedListMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     GenericViewSet,
 ):
     queryset = Airplane.objects.select_related("airplane_type")
     permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+    cache_models = (Airplane, AirplaneType)
+    query_budget = {"list": 3}
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -126,12 +188,17 @@ class AirplaneViewSet(
 
 
 class RouteViewSet(
+    CachedListMixin,
+    ValuesListMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     GenericViewSet,
 ):
     queryset = Route.objects.select_related("source", "destination")
+    values_serializer_class = RouteValuesSerializer
     permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+    cache_models = (Route, Airport)
+    query_budget = {"list": 3}
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -140,34 +207,59 @@ class RouteViewSet(
         return RouteSerializer
 
 
+class FlightKeysetPagination(KeysetPagination):
+    ordering = ("-departure_time", "id")
+
+
 class FlightViewSet(
+    SparseFieldsViewMixin,
+    ValuesListMixin,
     mixins.ListModelMixin,
     mixins.CreateModelMixin,
     mixins.RetrieveModelMixin,
     viewsets.GenericViewSet,
 ):
-    queryset = (
-        Flight.objects.prefetch_related("crew")
-        .select_related("route", "airplane")
-        .annotate(
-            tickets_available=(
-                F("airplane__rows") * F("airplane__seats_in_row")
-                - Count("tickets")
-            )
-        )
+    queryset = Flight.objects.prefetch_related("crew").select_related(
+        "route__source", "route__destination", "airplane"
     )
+    pagination_class = FlightKeysetPagination
+    values_serializer_class = FlightValuesSerializer
     permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+    query_budget = {"list": 5, "retrieve": 5, "search": 4, "itineraries": 5}
+    throttle_scopes = {
+        "search": "flight_search",
+        "itineraries": "flight_search",
+    }
 
     def get_queryset(self):
         date = self.request.query_params.get("date")
+        date_from = self.request.query_params.get("date_from")
+        date_to = self.request.query_params.get("date_to")
         route_id = self.request.query_params.get("route")
         crew = self.request.query_params.get("crew")
 
-        queryset = self.queryset
+        if self.action in ("list", "search", "retrieve"):
+            queryset = apply_query_plan(
+                Flight.objects.all(), self.get_serializer()
+            )
+        else:
+            queryset = self.queryset.all()
+
+        date, date_from, date_to = parse_dates(date, date_from, date_to)
 
         if date:
-            date = datetime.strptime(date, "%Y-%m-%d").date()
-            queryset = queryset.filter(departure_time__date=date)
+            queryset = queryset.filter(
+                departure_time__gte=date,
+                departure_time__lt=date + timedelta(days=1),
+            )
+
+        if date_from:
+            queryset = queryset.filter(departure_time__gte=date_from)
+
+        if date_to:
+            queryset = queryset.filter(
+                departure_time__lt=date_to + timedelta(days=1)
+            )
 
         if route_id:
             queryset = queryset.filter(route_id=int(route_id))
@@ -176,17 +268,83 @@ class FlightViewSet(
             crew_ids = [int(crew_id) for crew_id in crew.split(",")]
             queryset = queryset.filter(crew__id__in=crew_ids)
 
+        if self.action == "list" and self.batch_ids is not None:
+            queryset = queryset.filter(id__in=self.batch_ids)
+
         return queryset
 
     def get_serializer_class(self):
-        if self.action == "list":
+        if self.action == "list" and self.expand_detail:
+            return FlightDetailSerializer
+
+        if self.action in ("list", "search"):
             return FlightListSerializer
 
         if self.action == "retrieve":
+            if self.seat_map_encoding:
+                return FlightSeatMapDetailSerializer
+
             return FlightDetailSerializer
 
         return FlightSerializer
 
+    @cached_property
+    def batch_ids(self):
+        ids = self.request.query_params.get("ids")
+
+        if ids is None:
+            return None
+
+        try:
+            batch_ids = list(dict.fromkeys(int(id_) for id_ in ids.split(",")))
+        except ValueError:
+            raise ValidationError("ids must be comma separated integers")
+
+        if len(batch_ids) > MAX_BATCH_IDS:
+            raise ValidationError(
+                f"ids must list at most {MAX_BATCH_IDS} flights"
+            )
+
+        return batch_ids
+
+    def use_values_serializer(self):
+        context = self.get_serializer_context()
+
+        return (
+            self.batch_ids is None
+            and not self.expand_detail
+            and not context["fields"]
+            and not context["expand"]
+        )
+
+    @property
+    def expand_detail(self):
+        expand = parse_field_tree(self.request.query_params.get("expand", ""))
+
+        if "detail" not in expand:
+            return False
+
+        if self.batch_ids is None:
+            raise ValidationError("expand=detail requires ids")
+
+        return True
+
+    @property
+    def seat_map_encoding(self):
+        encoding = self.request.query_params.get("seat_map")
+
+        return encoding if encoding in SEAT_MAP_ENCODINGS else None
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["seat_map_encoding"] = self.seat_map_encoding
+
+        if "expand" in context:
+            # handled by the view, see expand_detail
+            context["expand"].pop("detail", None)
+
+        return context
+
     @extend_schema(
         parameters=[
             OpenApiParameter(
@@ -199,15 +357,240 @@ class FlightViewSet(
                 type=OpenApiTypes.DATE,
                 description="Filter by departure time (ex. ?date=2024-05-30)",
             ),
+            OpenApiParameter(
+                "date_from",
+                type=OpenApiTypes.DATE,
+                description="Filter by departure time from the date "
+                "(ex. ?date_from=2024-05-30)",
+            ),
+            OpenApiParameter(
+                "date_to",
+                type=OpenApiTypes.DATE,
+                description="Filter by departure time up to the date "
+                "inclusive (ex. ?date_to=2024-06-02)",
+            ),
             OpenApiParameter(
                 "crew",
                 type={"type": "list", "items": {"type": "number"}},
                 description="Filter by crew id (ex. ?crew=2,5)",
             ),
+            OpenApiParameter(
+                "ids",
+                type={"type": "list", "items": {"type": "number"}},
+                description="Get the flights with the ids, in their order "
+                f"and at most {MAX_BATCH_IDS} (ex. ?ids=3,1,2)",
+            ),
+            OpenApiParameter(
+                "fields",
+                type={"type": "list", "items": {"type": "string"}},
+                description="Return only these fields, nested ones as "
+                "dotted paths (ex. ?fields=id,departure_time,route.source)",
+            ),
+            OpenApiParameter(
+                "expand",
+                type={"type": "list", "items": {"type": "string"}},
+                description="Nest route, airplane, crew or taken_places "
+                "instead of their names, or return flight details with "
+                "detail (ex. ?expand=route,crew or ?ids=3,1&expand=detail)",
+            ),
         ]
     )
     def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+        if self.batch_ids is None:
+            return super().list(request, *args, **kwargs)
+
+        flights = {
+            flight.id: flight
+            for flight in self.filter_queryset(self.get_queryset())
+        }
+        serializer = self.get_serializer(
+            [flights[id_] for id_ in self.batch_ids if id_ in flights],
+            many=True,
+        )
+
+        return Response(serializer.data)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "from_city",
+                type=OpenApiTypes.INT,
+                required=True,
+                description="Departure city id (ex. ?from_city=1)",
+            ),
+            OpenApiParameter(
+                "to_city",
+                type=OpenApiTypes.INT,
+                required=True,
+                description="Arrival city id (ex. ?to_city=2)",
+            ),
+            OpenApiParameter(
+                "date_from",
+                type=OpenApiTypes.DATE,
+                description="Filter by departure time from the date "
+                "(ex. ?date_from=2024-05-30)",
+            ),
+            OpenApiParameter(
+                "date_to",
+                type=OpenApiTypes.DATE,
+                description="Filter by departure time up to the date "
+                "inclusive (ex. ?date_to=2024-06-02)",
+            ),
+            OpenApiParameter(
+                "seats",
+                type=OpenApiTypes.INT,
+                description="Only flights with at least this many "
+                "available seats (ex. ?seats=2)",
+            ),
+        ]
+    )
+    @action(methods=["GET"], detail=False)
+    def search(self, request):
+        """Find flights between two cities in one query"""
+        try:
+            from_city_id = int(request.query_params["from_city"])
+            to_city_id = int(request.query_params["to_city"])
+            seats = int(request.query_params.get("seats", 0))
+        except (KeyError, ValueError):
+            raise ValidationError(
+                "from_city and to_city city ids are required, "
+                "seats must be a number"
+            )
+
+        queryset = self.get_queryset().filter(
+            route__source__closest_big_city_id=from_city_id,
+            route__destination__closest_big_city_id=to_city_id,
+        )
+
+        if seats:
+            queryset = queryset.filter(
+                seats_sold__lte=(
+                    F("airplane__rows") * F("airplane__seats_in_row") - seats
+                )
+            )
+
+        page = self.paginate_queryset(queryset)
+
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(queryset, many=True)
+
+        return Response(serializer.data)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "from_city",
+                type=OpenApiTypes.INT,
+                required=True,
+                description="Departure city id (ex. ?from_city=1)",
+            ),
+            OpenApiParameter(
+                "to_city",
+                type=OpenApiTypes.INT,
+                required=True,
+                description="Arrival city id (ex. ?to_city=2)",
+            ),
+            OpenApiParameter(
+                "date",
+                type=OpenApiTypes.DATE,
+                required=True,
+                description="Departure date of the first flight "
+                "(ex. ?date=2024-05-30)",
+            ),
+            OpenApiParameter(
+                "seats",
+                type=OpenApiTypes.INT,
+                description="Number of seats needed on every flight "
+                "(ex. ?seats=2)",
+            ),
+        ],
+        responses=ItinerarySerializer(many=True),
+    )
+    @action(methods=["GET"], detail=False)
+    def itineraries(self, request):
+        """Find itineraries of up to three flights between two cities"""
+        try:
+            from_city_id = int(request.query_params["from_city"])
+            to_city_id = int(request.query_params["to_city"])
+            date = datetime.strptime(request.query_params["date"], "%Y-%m-%d")
+            seats = max(int(request.query_params.get("seats", 1)), 1)
+        except (KeyError, ValueError):
+            raise ValidationError(
+                "from_city and to_city city ids and date are required, "
+                "seats must be a number"
+            )
+
+        itineraries = search_itineraries(from_city_id, to_city_id, date, seats)
+        flights = self.queryset.in_bulk(
+            {
+                flight_id
+                for flight_ids in itineraries
+                for flight_id in flight_ids
+            }
+        )
+        data = []
+
+        for flight_ids in itineraries:
+            if not all(flight_id in flights for flight_id in flight_ids):
+                continue
+
+            legs = [flights[flight_id] for flight_id in flight_ids]
+            data.append(
+                {
+                    "departure_time": legs[0].departure_time,
+                    "arrival_time": legs[-1].arrival_time,
+                    "flights": legs,
+                }
+            )
+
+        serializer = ItinerarySerializer(
+            data, many=True, context=self.get_serializer_context()
+        )
+
+        return Response(serializer.data)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "seat_map",
+                type=OpenApiTypes.STR,
+                enum=SEAT_MAP_ENCODINGS,
+                description="Replace taken_places with a compact seat map "
+                "encoded as base64 bitset or run lengths (ex. ?seat_map=rle)",
+            ),
+        ]
+    )
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    @extend_schema(
+        request=SeatHoldSerializer(many=True),
+        responses=SeatHoldSerializer(many=True),
+    )
+    @action(
+        methods=["POST", "DELETE"],
+        detail=True,
+        permission_classes=(IsAuthenticated,),
+    )
+    def holds(self, request, pk=None):
+        """Hold seats of the flight for the current user until they expire"""
+        flight = self.get_object()
+
+        if request.method == "DELETE":
+            SeatHold.objects.filter(flight=flight, user=request.user).delete()
+
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        serializer = SeatHoldSerializer(
+            data=request.data, many=True, context={"flight": flight}
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save(flight=flight, user=request.user)
+
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
 class OrderPagination(PageNumberPagination):
@@ -215,18 +598,30 @@ class OrderPagination(PageNumberPagination):
     max_page_size = 100
 
 
+class OrderKeysetPagination(KeysetPagination):
+    ordering = ("-created_at", "id")
+    fallback_class = OrderPagination
+
+
 class OrderViewSet(
+    SparseFieldsViewMixin,
+    IdempotentCreateMixin,
     mixins.ListModelMixin,
     mixins.CreateModelMixin,
     GenericViewSet,
 ):
-    queryset = Order.objects.prefetch_related(
-        "tickets__flight__route", "tickets__flight__airplane"
-    )
-    pagination_class = OrderPagination
+    queryset = Order.objects.all()
+    pagination_class = OrderKeysetPagination
+    query_budget = {"list": 6}
+    throttle_scopes = {"create": "order_create"}
 
     def get_queryset(self):
-        return Order.objects.filter(user=self.request.user)
+        queryset = self.queryset.filter(user=self.request.user)
+
+        if self.action == "list":
+            queryset = apply_query_plan(queryset, self.get_serializer())
+
+        return queryset
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -234,5 +629,183 @@ class OrderViewSet(
 
         return OrderSerializer
 
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "fields",
+                type={"type": "list", "items": {"type": "string"}},
+                description="Return only these fields, nested ones as "
+                "dotted paths (ex. ?fields=id,tickets.row,tickets.seat)",
+            ),
+            OpenApiParameter(
+                "expand",
+                type={"type": "list", "items": {"type": "string"}},
+                description="Nest relations of the ticket flights "
+                "(ex. ?expand=tickets.flight.route)",
+            ),
+        ]
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "output",
+                type=OpenApiTypes.STR,
+                enum=tuple(EXPORT_FORMATS),
+                description="Export format, csv by default "
+                "(ex. ?output=ndjson)",
+            ),
+            OpenApiParameter(
+                "date_from",
+                type=OpenApiTypes.DATE,
+                description="Orders created from the date "
+                "(ex. ?date_from=2024-05-01)",
+            ),
+            OpenApiParameter(
+                "date_to",
+                type=OpenApiTypes.DATE,
+                description="Orders created up to the date inclusive "
+                "(ex. ?date_to=2024-05-31)",
+            ),
+        ],
+        responses={200: OpenApiTypes.BINARY},
+    )
+    @action(methods=["GET"], detail=False, permission_classes=(IsAdminUser,))
+    def export(self, request):
+        """Stream tickets of all orders for reconciliation"""
+        output = request.query_params.get("output", "csv")
+        date_from = request.query_params.get("date_from")
+        date_to = request.query_params.get("date_to")
+
+        if output not in EXPORT_FORMATS:
+            raise ValidationError(
+                f"output must be one of: {', '.join(EXPORT_FORMATS)}"
+            )
+
+        date_from, date_to = parse_dates(date_from, date_to)
+
+        if date_to:
+            date_to += timedelta(days=1)
+
+        write, content_type = EXPORT_FORMATS[output]
+        response = StreamingHttpResponse(
+            write(export_rows(date_from, date_to)), content_type=content_type
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="orders.{output}"'
+        )
+
+        return response
+
+
+OCCUPANCY_ROWS = inline_serializer(
+    "OccupancyRow",
+    fields={
+        # grouping fields, present depending on group_by
+        "route_id": serializers.IntegerField(required=False),
+        "source": serializers.CharField(required=False),
+        "destination": serializers.CharField(required=False),
+        "day": serializers.DateField(required=False),
+        "airplane_type_id": serializers.IntegerField(required=False),
+        "airplane_type": serializers.CharField(required=False),
+        "flights": serializers.IntegerField(),
+        "seats": serializers.IntegerField(),
+        "seats_sold": serializers.IntegerField(),
+        "load_factor": serializers.FloatField(allow_null=True),
+    },
+    many=True,
+)
+
+ANALYTICS_DATE_PARAMETERS = [
+    OpenApiParameter(
+        "date_from",
+        type=OpenApiTypes.DATE,
+        description="Flights departing from the date "
+        "(ex. ?date_from=2024-05-01)",
+    ),
+    OpenApiParameter(
+        "date_to",
+        type=OpenApiTypes.DATE,
+        description="Flights departing up to the date inclusive "
+        "(ex. ?date_to=2024-05-31)",
+    ),
+]
+
+
+class AnalyticsViewSet(viewsets.ViewSet):
+    """Occupancy of flights, read from the RouteOccupancy aggregates"""
+
+    permission_classes = (IsAdminUser,)
+    query_budget = {"occupancy": 3, "top_routes": 3}
+
+    def get_date_window(self):
+        return [
+            value and value.date()
+            for value in parse_dates(
+                self.request.query_params.get("date_from"),
+                self.request.query_params.get("date_to"),
+            )
+        ]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "group_by",
+                type=OpenApiTypes.STR,
+                enum=list(OCCUPANCY_GROUPS),
+                description="Group by route, day or airplane type "
+                "(ex. ?group_by=day), route by default",
+            ),
+            *ANALYTICS_DATE_PARAMETERS,
+        ],
+        responses=OCCUPANCY_ROWS,
+    )
+    @action(methods=["GET"], detail=False)
+    def occupancy(self, request):
+        """Flights, seats, sold seats and load factor per group"""
+        group_by = request.query_params.get("group_by", "route")
+
+        if group_by not in OCCUPANCY_GROUPS:
+            raise ValidationError(
+                f"group_by must be one of: {', '.join(OCCUPANCY_GROUPS)}"
+            )
+
+        return Response(occupancy(group_by, *self.get_date_window()))
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "limit",
+                type=OpenApiTypes.INT,
+                description="Number of routes, 10 by default (ex. ?limit=5)",
+            ),
+            *ANALYTICS_DATE_PARAMETERS,
+        ],
+        responses=OCCUPANCY_ROWS,
+    )
+    @action(methods=["GET"], detail=False)
+    def top_routes(self, request):
+        """Routes with the most seats sold"""
+        try:
+            limit = int(request.query_params.get("limit", 10))
+        except ValueError:
+            raise ValidationError("limit must be an integer")
+
+        return Response(
+            top_routes(max(limit, 0), *self.get_date_window())
+        )
+
+
+class DatabaseStatsView(APIView):
+    """Connection reuse statistics of the worker serving the request"""
+
+    permission_classes = (IsAdminUser,)
+
+    @extend_schema(responses=OpenApiTypes.OBJECT)
+    def get(self, request):
+        return Response(db_stats.snapshot())
@@ -0,0 +1,40 @@
+"""Settings for serving the API with gunicorn in production.
+
+Run with DJANGO_SETTINGS_MODULE=airport_service.production_settings.
+"""
+
+import os
+
+from airport_service.settings import *  # noqa: F401,F403
+from airport_service.settings import (
+    INSTALLED_APPS,
+    MIDDLEWARE,
+    REST_FRAMEWORK,
+)
+
+DEBUG = False
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app != "debug_toolbar"]
+
+MIDDLEWARE = [
+    middleware
+    for middleware in MIDDLEWARE
+    if not middleware.startswith("debug_toolbar.")
+]
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    "DEFAULT_RENDERER_CLASSES": ("rest_framework.renderers.JSONRenderer",),
+}
+
+# gunicorn runs several worker processes, which must share the cached
+# responses, their versions and the itineraries
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND",
+            "django.core.cache.backends.filebased.FileBasedCache",
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", "/files/media/cache"),
+    }
+}
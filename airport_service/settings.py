@@ -9,7 +9,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = os.getenv("DJANGO_SECRET_KEY")
 
-DEBUG = os.getenv("DEBUG")
+DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true", "yes", "on")
 
 ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS").split(" ")
 
@@ -26,22 +26,25 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     "rest_framework",
     "drf_spectacular",
-    "debug_toolbar",
     "airport",
     "user",
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "airport.query_budget.QueryBudgetMiddleware",
 ]
 
+if DEBUG:
+    INSTALLED_APPS.append("debug_toolbar")
+    MIDDLEWARE.insert(1, "debug_toolbar.middleware.DebugToolbarMiddleware")
+
 ROOT_URLCONF = "airport_service.urls"
 
 TEMPLATES = [
@@ -64,12 +67,31 @@ WSGI_APPLICATION = "airport_service.wsgi.application"
 
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        "ENGINE": "airport.db_backend",
         "NAME": os.getenv("POSTGRES_DB"),
         "USER": os.getenv("POSTGRES_USER"),
         "PASSWORD": os.getenv("POSTGRES_PASSWORD"),
         "HOST": os.getenv("POSTGRES_HOST"),
         "PORT": os.getenv("POSTGRES_PORT"),
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", 60)),
+        "CONN_HEALTH_CHECKS": True,
+    }
+}
+
+if os.getenv("DB_POOL_MAX_SIZE"):
+    # pooled connections go back to the pool at the end of each request
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["POOL"] = {
+        "MIN_SIZE": int(os.getenv("DB_POOL_MIN_SIZE", 1)),
+        "MAX_SIZE": int(os.getenv("DB_POOL_MAX_SIZE")),
+    }
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", "airport-service"),
     }
 }
 
@@ -109,12 +131,18 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.UserRateThrottle",
+        "airport.throttling.AnonRateThrottle",
+        "airport.throttling.UserRateThrottle",
+        "airport.throttling.ActionRateThrottle",
     ],
-    "DEFAULT_THROTTLE_RATES": {"anon": "10/day", "user": "30/day"},
+    "DEFAULT_THROTTLE_RATES": {
+        "anon": "10/day",
+        "user": "30/day",
+        "order_create": "10/hour",
+        "flight_search": "20/hour",
+    },
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "user.authentication.CachedJWTAuthentication",
     ),
 }
 
@@ -131,8 +159,49 @@ SPECTACULAR_SETTINGS = {
     },
 }
 
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {
+        "airport.query_budget": {"handlers": ["console"], "level": "WARNING"},
+        "airport.jobs": {"handlers": ["console"], "level": "WARNING"},
+    },
+}
+
+SEAT_HOLD_TTL = timedelta(minutes=10)
+
+IDEMPOTENCY_KEY_TTL = timedelta(hours=24)
+
+JOB_MAX_ATTEMPTS = 5
+JOB_RETRY_DELAY = timedelta(seconds=30)
+JOB_TIMEOUT = timedelta(minutes=5)
+
+CONFIRMATION_ROOT = os.getenv(
+    "CONFIRMATION_ROOT", BASE_DIR / "media" / "confirmations"
+)
+NOTIFICATION_SINK = os.getenv(
+    "NOTIFICATION_SINK", BASE_DIR / "media" / "notifications.jsonl"
+)
+
+# a database alias for the database store, a file path for SQLite
+THROTTLE_BACKEND = os.getenv(
+    "THROTTLE_BACKEND", "airport.throttling.DatabaseThrottleStore"
+)
+THROTTLE_LOCATION = os.getenv("THROTTLE_LOCATION", "default")
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=7),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
     "ROTATE_REFRESH_TOKENS": False,
+    "TOKEN_OBTAIN_SERIALIZER": (
+        "user.serializers.UserTokenObtainPairSerializer"
+    ),
 }
+
+AUTH_USER_CACHE_TTL = timedelta(seconds=60)
+
+# let read-only requests authenticate from the signed token claims alone
+AUTH_TRUST_TOKEN_CLAIMS = os.getenv(
+    "AUTH_TRUST_TOKEN_CLAIMS", ""
+).lower() in ("1", "true", "yes", "on")
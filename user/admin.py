@@ -3,6 +3,9 @@ from django.contrib.auth.admin import UserAdmin as DjangoUserAdmin
 from django.utils.translation import gettext as _
 from .models import User
 
+# changing these revokes the tokens issued to the user
+TOKEN_CLAIM_FIELDS = {"is_active", "is_staff", "is_superuser"}
+
 
 @admin.register(User)
 class UserAdmin(DjangoUserAdmin):
@@ -37,3 +40,9 @@ class UserAdmin(DjangoUserAdmin):
     list_display = ("email", "first_name", "last_name", "is_staff")
     search_fields = ("email", "first_name", "last_name")
     ordering = ("email",)
+
+    def save_model(self, request, obj, form, change):
+        if change and set(form.changed_data) & TOKEN_CLAIM_FIELDS:
+            obj.token_version += 1
+
+        super().save_model(request, obj, form, change)
@@ -0,0 +1,121 @@
+import threading
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+_lock = threading.Lock()
+_users = {}
+# latest token version of users saved or deleted in this process
+_versions = {}
+
+
+def cache_user(user):
+    expires_at = time.monotonic() + (
+        settings.AUTH_USER_CACHE_TTL.total_seconds()
+    )
+
+    with _lock:
+        _users[user.pk] = (user.token_version, user, expires_at)
+
+
+def get_cached_user(user_id, version):
+    entry = _users.get(user_id)
+
+    if entry is None:
+        return None
+
+    cached_version, user, expires_at = entry
+
+    if cached_version != version or expires_at <= time.monotonic():
+        return None
+
+    return user
+
+
+def invalidate_user(user_id, version=None):
+    """Drop a user from the cache, ``version`` None for deleted users"""
+    with _lock:
+        _users.pop(user_id, None)
+        _versions[user_id] = version
+
+
+def is_known_stale(user_id, version):
+    return user_id in _versions and _versions[user_id] != version
+
+
+def clear_user_cache():
+    with _lock:
+        _users.clear()
+        _versions.clear()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWT authentication resolving users from an in-process cache.
+
+    Users are cached for AUTH_USER_CACHE_TTL by id and token version
+    (the ``ver`` claim). Changing the password, or the staff or active
+    status in the admin, bumps the user's version, so tokens issued
+    before stop authenticating. Saving a user drops it from the cache
+    of the current process; other processes notice within the TTL.
+
+    With AUTH_TRUST_TOKEN_CLAIMS on, read-only requests of non-staff
+    users on a cache miss do not query the database: the user is built
+    from the ``user_id`` claim, which the token signature vouches for.
+    Such a token stays usable for reads after a revocation made by
+    another process, until it expires. Staff tokens, tokens of users
+    changed in this process and tokens without a ``ver`` claim always
+    load the user.
+    """
+
+    def authenticate(self, request):
+        self.read_only = request.method in SAFE_METHODS
+        return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        version = validated_token.get("ver")
+
+        if version is None:
+            return super().get_user(validated_token)
+
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        user = get_cached_user(user_id, version)
+
+        if user is not None:
+            return user
+
+        if (
+            settings.AUTH_TRUST_TOKEN_CLAIMS
+            and self.read_only
+            and validated_token.get("is_staff") is False
+            and not is_known_stale(user_id, version)
+        ):
+            return self.get_token_user(user_id, version)
+
+        user = super().get_user(validated_token)
+
+        if user.token_version != version:
+            raise AuthenticationFailed(
+                _("Token has been revoked"), code="token_revoked"
+            )
+
+        cache_user(user)
+
+        return user
+
+    def get_token_user(self, user_id, version):
+        user = self.user_model(
+            **{api_settings.USER_ID_FIELD: user_id},
+            is_active=True,
+            is_staff=False,
+            token_version=version,
+        )
+        user._state.adding = False
+        user._state.db = DEFAULT_DB_ALIAS
+
+        return user
@@ -0,0 +1,110 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from drf_spectacular.generators import SchemaGenerator
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from user.authentication import clear_user_cache
+
+TOKEN_URL = reverse("user:token_obtain_pair")
+MANAGE_URL = reverse("user:manage")
+CITY_URL = reverse("airport:city-list")
+DB_STATS_URL = reverse("airport:db-stats")
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        clear_user_cache()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com", password="test123"
+        )
+        self.token = self.obtain_token("test123")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+
+    def obtain_token(self, password):
+        res = self.client.post(
+            TOKEN_URL, {"email": "test@test.com", "password": password}
+        )
+
+        return res.data["access"]
+
+    def test_user_loaded_once_within_ttl(self):
+        # user, throttle counter and cities
+        with self.assertNumQueries(3):
+            self.client.get(CITY_URL)
+
+        cache.clear()
+
+        with self.assertNumQueries(2):
+            res = self.client.get(CITY_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_password_change_revokes_token(self):
+        res = self.client.patch(MANAGE_URL, {"password": "new123"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.client.get(CITY_URL)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        token = self.obtain_token("new123")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        res = self.client.get(CITY_URL)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    @override_settings(AUTH_TRUST_TOKEN_CLAIMS=True)
+    def test_read_only_request_trusts_claims(self):
+        with self.assertNumQueries(2):
+            res = self.client.get(CITY_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.client.post(CITY_URL, {"name": "Kyiv"})
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(AUTH_TRUST_TOKEN_CLAIMS=True)
+    def test_password_change_revokes_trusted_token(self):
+        res = self.client.patch(MANAGE_URL, {"password": "new123"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.client.get(CITY_URL)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        token = self.obtain_token("new123")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        res = self.client.get(CITY_URL)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    @override_settings(AUTH_TRUST_TOKEN_CLAIMS=True)
+    def test_staff_token_claims_not_trusted(self):
+        self.user.is_staff = True
+        self.user.save()
+        token = self.obtain_token("test123")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        res = self.client.get(DB_STATS_URL)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        self.user.is_staff = False
+        self.user.save()
+        # as seen by another process, which did not save the user
+        clear_user_cache()
+
+        res = self.client.get(DB_STATS_URL)
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class AuthenticationSchemaTests(TestCase):
+    def test_api_operations_document_jwt_auth(self):
+        schema = SchemaGenerator().get_schema(request=None, public=True)
+
+        self.assertIn(
+            {"jwtAuth": []},
+            schema["paths"]["/api/airport/flights/"]["get"]["security"],
+        )